@@ -11,12 +11,15 @@ Usage:
     python main_scripts.py                           # 執行今日任務
     python main_scripts.py --date 2026-01-10        # 執行指定日期
     python main_scripts.py --from 2026-01-05 --to 2026-01-10  # 執行日期範圍
+    python main_scripts.py --from 2026-01-05 --to 2026-01-10 --workers 2  # 同時處理 2 天 (預設依序執行)
 """
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from src.utils.logger import setup_logger
 from src.orchestrator.daily_workflow import DailyWorkflow
+from src.repositories.tcat_repository import TcatRepository
 from loguru import logger
 
 
@@ -66,12 +69,14 @@ def main():
   python main_scripts.py                           # 執行今日任務
   python main_scripts.py --date 2026-01-10        # 執行指定日期
   python main_scripts.py --from 2026-01-05 --to 2026-01-10  # 執行日期範圍
+  python main_scripts.py --from 2026-01-05 --to 2026-01-10 --workers 2  # 同時處理 2 天
         """,
     )
     parser.add_argument("--date", "-d", type=str, help="指定執行日期 (格式: YYYY-MM-DD)")
     parser.add_argument("--from", "-f", dest="from_date", type=str, help="起始日期 (格式: YYYY-MM-DD)，需搭配 --to 使用")
     parser.add_argument("--to", "-t", dest="to_date", type=str, help="結束日期 (格式: YYYY-MM-DD)，需搭配 --from 使用")
     parser.add_argument("--no-notify", action="store_true", help="不發送客戶通知 (批次補執行時建議使用)")
+    parser.add_argument("--workers", "-w", type=int, default=1, help="批次模式同時處理的天數 (預設: 1，依序執行)")
 
     args = parser.parse_args()
 
@@ -82,6 +87,9 @@ def main():
     if args.date and (args.from_date or args.to_date):
         parser.error("--date 不能與 --from/--to 同時使用")
 
+    if args.workers < 1:
+        parser.error("--workers 必須大於 0")
+
     # Setup logging
     setup_logger(log_file="logs/app.log")
 
@@ -101,24 +109,50 @@ def main():
     logger.info("=" * 50)
 
     # Run workflow for each date
-    workflow = DailyWorkflow(notify_customers=notify_customers)
     success_count = 0
     fail_count = 0
 
-    for i, target_date in enumerate(dates, 1):
-        date_str = target_date.strftime("%Y-%m-%d")
+    if total_dates == 1 or args.workers == 1:
+        workflow = DailyWorkflow(notify_customers=notify_customers)
 
-        if total_dates > 1:
-            logger.info(f"\n{'=' * 30}")
-            logger.info(f"處理進度: {i}/{total_dates} - {date_str}")
-            logger.info(f"{'=' * 30}")
+        for i, target_date in enumerate(dates, 1):
+            date_str = target_date.strftime("%Y-%m-%d")
 
-        success = workflow.run(target_date=target_date)
+            if total_dates > 1:
+                logger.info(f"\n{'=' * 30}")
+                logger.info(f"處理進度: {i}/{total_dates} - {date_str}")
+                logger.info(f"{'=' * 30}")
 
-        if success:
-            success_count += 1
-        else:
-            fail_count += 1
+            if workflow.run(target_date=target_date):
+                success_count += 1
+            else:
+                fail_count += 1
+    else:
+        # Each worker gets its own workflow (own IMAP/LINE state). The Tcat caches are
+        # class-level, so they are cleared once here rather than by each date mid-run;
+        # C2CService holds a per-sheet lock around each sheet's read -> compute -> write.
+        TcatRepository.clear_cache()
+
+        def run_date(target_date: datetime) -> bool:
+            return DailyWorkflow(notify_customers=notify_customers).run(
+                target_date=target_date, clear_tcat_cache=False
+            )
+
+        with ThreadPoolExecutor(max_workers=min(args.workers, total_dates)) as executor:
+            futures = {executor.submit(run_date, target_date): target_date for target_date in dates}
+            for i, future in enumerate(as_completed(futures), 1):
+                date_str = futures[future].strftime("%Y-%m-%d")
+                try:
+                    success = future.result()
+                except Exception as e:
+                    logger.error(f"{date_str} 執行失敗: {e}")
+                    success = False
+
+                if success:
+                    success_count += 1
+                else:
+                    fail_count += 1
+                logger.info(f"處理進度: {i}/{total_dates} - {date_str} {'完成' if success else '失敗'}")
 
     # Summary
     logger.info("=" * 50)
@@ -45,7 +45,7 @@ def get_database_url():
 
 
 def get_migration_files(migrations_dir: Path):
-    """取得所有 migration 檔案，按編號排序"""
+    """取得所有 migration 檔案的 (檔名, SQL 內容)，按編號排序並預先讀入記憶體"""
     if not migrations_dir.exists():
         logger.error(f"migrations 資料夾不存在: {migrations_dir}")
         sys.exit(1)
@@ -56,29 +56,35 @@ def get_migration_files(migrations_dir: Path):
         logger.warning("沒有找到任何 migration 檔案")
         return []
 
-    return sql_files
+    return [(sql_file.name, sql_file.read_text(encoding='utf-8')) for sql_file in sql_files]
 
 
-def run_migration(conn, migration_file: Path):
-    """執行單個 migration 檔案"""
-    logger.info(f"執行 migration: {migration_file.name}")
+def run_migration(cur, name: str, sql: str, index: int):
+    """執行單個 migration（在 savepoint 中，失敗只回滾該檔案）"""
+    logger.info(f"執行 migration: {name}")
+    savepoint = f"migration_{index}"
 
     try:
-        # 讀取 SQL 檔案
-        with open(migration_file, 'r', encoding='utf-8') as f:
-            sql = f.read()
-
         # 執行 SQL
-        with conn.cursor() as cur:
-            cur.execute(sql)
+        cur.execute(f"SAVEPOINT {savepoint}")
+        cur.execute(sql)
+        cur.execute(f"RELEASE SAVEPOINT {savepoint}")
 
-        conn.commit()
-        logger.success(f"{migration_file.name} 執行成功")
+        logger.success(f"{name} 執行成功")
         return True
 
     except Exception as e:
-        conn.rollback()
-        logger.error(f"{migration_file.name} 執行失敗: {e}")
+        logger.error(f"{name} 執行失敗: {e}")
+        try:
+            cur.execute(f"ROLLBACK TO SAVEPOINT {savepoint}")
+        except Exception as rollback_error:
+            # savepoint 無法回滾（例如連線中斷）時，放棄整個 transaction 後中止
+            logger.error(f"回滾 {name} 的 savepoint 失敗，回滾整個 transaction: {rollback_error}")
+            try:
+                cur.connection.rollback()
+            except Exception as conn_error:
+                logger.error(f"回滾 transaction 失敗: {conn_error}")
+            raise
         return False
 
 
@@ -114,11 +120,15 @@ def main():
     success_count = 0
     fail_count = 0
 
-    for migration_file in migration_files:
-        if run_migration(conn, migration_file):
-            success_count += 1
-        else:
-            fail_count += 1
+    # 所有 migrations 在同一個 transaction 內執行，最後只 commit 一次
+    with conn.cursor() as cur:
+        for index, (name, sql) in enumerate(migration_files):
+            if run_migration(cur, name, sql, index):
+                success_count += 1
+            else:
+                fail_count += 1
+
+    conn.commit()
 
     # 關閉連線
     conn.close()
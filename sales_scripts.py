@@ -54,8 +54,8 @@ def main():
 
     # Parse dates
     try:
-        start_date = datetime.strptime(args.start, "%Y-%m-%d")
-        end_date = datetime.strptime(args.end, "%Y-%m-%d")
+        start_date = datetime.fromisoformat(args.start)
+        end_date = datetime.fromisoformat(args.end)
     except ValueError:
         print("錯誤: 日期格式必須是 YYYY-MM-DD")
         print("例如: python sales_scripts.py --start 2026-01-01 --end 2026-01-05")
@@ -1,5 +1,6 @@
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
 
 # Load .env file from project root
@@ -12,16 +13,22 @@ _env_path = _project_root / ".env"
 load_dotenv(_env_path)
 
 
+@lru_cache(maxsize=None)
+def load_config_json(filename: str) -> dict:
+    """
+    Load a JSON file from the config directory, parsed once per process.
+
+    The returned dict is shared between callers and must not be mutated.
+    """
+    with open(_current_file.parent / filename, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
 class ConfigManager:
 
     def __init__(self):
-        # Get the directory where config.py is located
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-
-        # Load field config
-        field_config_path = os.path.join(current_dir, "field_config.json")
-        with open(field_config_path, "r", encoding="utf-8") as f:
-            self.config = json.load(f)
+        # Load field config (cached after the first load)
+        self.config = load_config_json("field_config.json")
 
         # Initialize configuration fields
         self.flowdite_backup_sheet = self.config["flowtide"]["backup_sheet_name_format"]
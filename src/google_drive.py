@@ -1,4 +1,8 @@
+import threading
+import time
+from functools import lru_cache
 import pygsheets
+from pygsheets.utils import format_addr
 from googleapiclient.discovery import build
 from google.oauth2 import service_account
 from loguru import logger
@@ -7,19 +11,59 @@ from src.config.config import ConfigManager, SettingsManager
 CONFIG = ConfigManager()
 SETTINGS = SettingsManager()
 
+# googleapiclient retries 429/5xx responses with exponential backoff up to this many times
+API_NUM_RETRIES = 5
+
+
+def a1_range(title, cell=None):
+    # Quote the worksheet title for A1 notation, doubling any single quotes it contains
+    sheet = "'{}'".format(title.replace("'", "''"))
+    return f"{sheet}!{cell}" if cell else sheet
+
+
+@lru_cache(maxsize=None)
+def load_credentials(service_account_file, scopes):
+    # Parse the service account key once per process; google-auth refreshes the token as needed
+    return service_account.Credentials.from_service_account_file(service_account_file, scopes=list(scopes))
+
+
+# API clients wrap a non-thread-safe HTTP transport, so they are shared per thread rather than per process
+_thread_clients = threading.local()
+
+
+def load_clients(credentials):
+    # Build the Drive/Sheets services and the pygsheets client once per thread and credentials
+    clients = getattr(_thread_clients, "clients", None)
+    if clients is None or clients[0] is not credentials:
+        clients = (
+            credentials,
+            build("drive", "v3", credentials=credentials, cache_discovery=False),
+            build("sheets", "v4", credentials=credentials, cache_discovery=False),
+            pygsheets.authorize(custom_credentials=credentials),
+        )
+        _thread_clients.clients = clients
+    return clients[1:]
+
 
 class C2CGoogleSheet:
 
+    # Spreadsheet inventory from Drive, shared by all instances as (fetched_at, {name: id})
+    SHEETS_CACHE_TTL = 6 * 60 * 60
+    _sheets_cache = None
+
     def __init__(self):
         self.sht = None
         self.scopes = ["https://www.googleapis.com/auth/drive"]
         self.service_account_file = SETTINGS.service_account_file
-        self.credentials = service_account.Credentials.from_service_account_file(self.service_account_file, scopes=self.scopes)
-        self.service = build("drive", "v3", credentials=self.credentials)
-        self.gc = pygsheets.authorize(service_file=self.service_account_file)
+        self.credentials = load_credentials(self.service_account_file, tuple(self.scopes))
+        self.service, self.sheets_service, self.gc = load_clients(self.credentials)
 
-    def get_all_sheets(self):
-        results = self.service.files().list(q="mimeType='application/vnd.google-apps.spreadsheet'", fields="files(id, name)").execute()
+    def get_all_sheets(self, refresh=False):
+        cache = C2CGoogleSheet._sheets_cache
+        if not refresh and cache and time.time() - cache[0] < self.SHEETS_CACHE_TTL:
+            return cache[1]
+
+        results = self.service.files().list(q="mimeType='application/vnd.google-apps.spreadsheet'", fields="files(id, name)").execute(num_retries=API_NUM_RETRIES)
         files = results.get("files", [])
         if not files:
             logger.warning("No files found.")
@@ -28,11 +72,14 @@ class C2CGoogleSheet:
             for file in files:
                 logger.info(f"Name: {file['name']}, ID: {file['id']}")
                 file_dict[file["name"]] = file["id"]
+            C2CGoogleSheet._sheets_cache = (time.time(), file_dict)
             return file_dict
 
     def open_sheet(self, name=None, url=None):
         if name:
-            self.sht = self.gc.open(name)
+            # Known IDs skip the Drive name lookup that gc.open() does
+            sheet_id = C2CGoogleSheet._sheets_cache[1].get(name) if C2CGoogleSheet._sheets_cache else None
+            self.sht = self.gc.open_by_key(sheet_id) if sheet_id else self.gc.open(name)
         elif url:
             self.sht = self.gc.open_by_url(url)
         else:
@@ -42,7 +89,14 @@ class C2CGoogleSheet:
         return self.sht[sheet_index]
 
     def get_worksheet_all_values(self, worksheet):
-        return worksheet.get_all_values()
+        # One values.get-style read of the used range, padded to a rectangle like pygsheets returns
+        values = self.batch_get_values(worksheet.spreadsheet.id, [a1_range(worksheet.title)])[0]
+        width = max((len(row) for row in values), default=0)
+        return [row + [""] * (width - len(row)) for row in values]
+
+    def batch_get_values(self, spreadsheet_id, ranges):
+        result = self.sheets_service.spreadsheets().values().batchGet(spreadsheetId=spreadsheet_id, ranges=ranges).execute(num_retries=API_NUM_RETRIES)
+        return [value_range.get("values", []) for value_range in result.get("valueRanges", [])]
 
     def find_c2c_track_sheet(self, sheets):
         date_format = "%Y%m"
@@ -53,9 +107,15 @@ class C2CGoogleSheet:
         logger.info(target_sheets)
         return target_sheets
 
-    def update_worksheet(self, worksheet, df):
+    def batch_update_values(self, spreadsheet_id, data):
+        body = {"valueInputOption": "USER_ENTERED", "data": data}
+        return self.sheets_service.spreadsheets().values().batchUpdate(spreadsheetId=spreadsheet_id, body=body).execute(num_retries=API_NUM_RETRIES)
+
+    def update_worksheet(self, worksheet, df, current_values=None):
         try:
-            headers = worksheet.get_row(1)
+            if current_values is None:
+                current_values = self.get_worksheet_all_values(worksheet)
+            headers = current_values[0] if current_values else []
             headers = [col for col in headers if col != ""]
             if not headers:
                 raise ValueError("工作表為空，無法獲取標題")
@@ -64,31 +124,30 @@ class C2CGoogleSheet:
             unprotected_headers = headers[protected_columns:]
             if not unprotected_headers:
                 raise ValueError("無可更新的未受保護欄位")
-            df = df[unprotected_headers]
-            data_without_headers = []
-            for index, row in df.iterrows():
-                if row[CONFIG.c2c_delivery_number] == "":
-                    data_without_headers.append([""] * len(unprotected_headers))
-                else:
-                    data_without_headers.append(row.tolist())
-            
-            num_rows = len(data_without_headers) + 1
-            num_cols = len(df.columns)
-            start_col_letter = chr(64 + protected_columns + 1)
-            end_col_letter = chr(64 + protected_columns + num_cols)
-            
-            # 檢查並擴展工作表大小
-            current_rows = worksheet.rows
-            current_cols = worksheet.cols
-            required_rows = protected_columns + num_cols  # 總列數
-            required_cols = num_rows  # 總行數
-            
-            if required_cols > current_cols or required_rows > current_rows:
-                logger.info(f"擴展工作表: 從 {current_rows}x{current_cols} 到 {required_rows}x{required_cols}")
-                worksheet.resize(rows=required_cols, cols=required_rows)
-            
-            worksheet.update_values(crange=f"{start_col_letter}2:{end_col_letter}{num_rows}", values=data_without_headers)
-            logger.success("成功更新 Google Sheet")
+            aligned = df.reindex(columns=unprotected_headers, fill_value="")
+            values = aligned.to_numpy(dtype=object, na_value="")
+            # Rows without a delivery number are written blank
+            values[aligned[CONFIG.c2c_delivery_number].eq("").to_numpy(dtype=bool, na_value=False)] = ""
+            data_without_headers = values.tolist()
+
+            # Only send cells that differ from what is already in the sheet
+            data = []
+            for row_offset, new_row in enumerate(data_without_headers):
+                current_row = current_values[row_offset + 1] if row_offset + 1 < len(current_values) else []
+                for col_offset, value in enumerate(new_row):
+                    col_index = protected_columns + col_offset
+                    new_value = "" if value is None else str(value)
+                    current_value = current_row[col_index] if col_index < len(current_row) else ""
+                    if new_value != str(current_value):
+                        cell = format_addr((row_offset + 2, col_index + 1), "label")
+                        data.append({"range": a1_range(worksheet.title, cell), "values": [[new_value]]})
+
+            if not data:
+                logger.info("Google Sheet 沒有需要更新的儲存格")
+                return True
+
+            self.batch_update_values(worksheet.spreadsheet.id, data)
+            logger.success(f"成功更新 Google Sheet ({len(data)} 個儲存格)")
             return True
         except Exception as e:
             logger.error(f"更新 Google Sheet 時發生錯誤: {str(e)}")
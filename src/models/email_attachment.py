@@ -6,7 +6,7 @@ from typing import List, Optional
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class EmailAttachment:
     """
     Represents an email attachment.
@@ -17,7 +17,7 @@ class EmailAttachment:
     size: int
 
 
-@dataclass
+@dataclass(slots=True)
 class EmailSender:
     """
     Represents an email sender.
@@ -26,7 +26,7 @@ class EmailSender:
     email: str
 
 
-@dataclass
+@dataclass(slots=True)
 class EmailData:
     """
     Represents parsed email data.
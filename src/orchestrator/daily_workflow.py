@@ -12,6 +12,7 @@ from src.services.c2c_service import C2CService
 from src.services.shopline_service import ShopLineService
 from src.services.notification_service import NotificationService
 from src.services.sales_service import SalesService
+from src.repositories.tcat_repository import TcatRepository
 
 
 class DailyWorkflow:
@@ -40,12 +41,14 @@ class DailyWorkflow:
         self.notification = NotificationService()
         self.notify_customers = notify_customers
 
-    def run(self, target_date: Optional[datetime] = None) -> bool:
+    def run(self, target_date: Optional[datetime] = None, clear_tcat_cache: bool = True) -> bool:
         """
         Run the complete daily workflow.
 
         Args:
             target_date: Date to process (default: today)
+            clear_tcat_cache: Clear the shared Tcat caches first; concurrent batch runs
+                clear them once up front instead, so one date can't wipe another's results
 
         Returns:
             True if workflow completed successfully
@@ -57,6 +60,10 @@ class DailyWorkflow:
             date_str = target_date.strftime("%Y-%m-%d")
             logger.info(f"開始執行每日更新 - 目標日期: {date_str}")
 
+            # Tcat results are shared between the C2C and ShopLine steps of one run
+            if clear_tcat_cache:
+                TcatRepository.clear_cache()
+
             # Step 1: Fetch emails
             success = self._step_fetch_emails(target_date)
             if not success:
@@ -114,13 +121,13 @@ class DailyWorkflow:
         # Build order status dict
         order_status_dict = self.c2c_service.build_order_status_dict(c2c_orders)
 
-        # Process each target sheet
+        # Process target sheets (concurrently when there are several)
         target_sheets = self.c2c_service.get_target_sheets()
 
-        for sheet_name in target_sheets:
-            self.notification.add_message(f"Google Sheet: {sheet_name}")
+        results = self.c2c_service.process_sheets(target_sheets, order_status_dict)
 
-            update_count, error = self.c2c_service.process_sheet(sheet_name, order_status_dict)
+        for sheet_name, update_count, error in results:
+            self.notification.add_message(f"Google Sheet: {sheet_name}")
 
             if error:
                 self.notification.add_message(f"處理失敗: {error}")
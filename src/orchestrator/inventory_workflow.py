@@ -95,7 +95,7 @@ class InventoryWorkflow:
         except Exception as e:
             logger.error(f"庫存同步失敗: {e}")
             self.notification.add_message(f"庫存同步失敗: {e}")
-            self.notification.send_and_clear()
+            self.notification.send_and_clear_async()
             return False
 
     def sync_specific_date(self, target_date: datetime, send_notification: bool = False) -> dict:
@@ -7,6 +7,7 @@ from loguru import logger
 
 from src.services.shopline_service import ShopLineService
 from src.services.notification_service import NotificationService
+from src.repositories.tcat_repository import TcatRepository
 
 
 class OutstandingOrderWorkflow:
@@ -42,6 +43,7 @@ class OutstandingOrderWorkflow:
         """
         try:
             logger.info("開始執行待處理訂單更新流程")
+            TcatRepository.clear_cache()
 
             # Process outstanding orders
             update_count = self.shopline_service.process_outstanding_orders(notify=self.notify_customers)
@@ -6,7 +6,7 @@ import email
 import re
 from email.header import decode_header
 from email.utils import parsedate_to_datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
 from loguru import logger
 
@@ -19,6 +19,9 @@ class GmailRepository:
     Repository for Gmail IMAP operations.
     """
 
+    # Max messages requested in a single IMAP FETCH command
+    FETCH_BATCH_SIZE = 100
+
     def __init__(self, email_address: Optional[str] = None, password: Optional[str] = None):
         """
         Initialize Gmail repository.
@@ -135,11 +138,10 @@ class GmailRepository:
             # because they are Base64 encoded. Just download and filter.
 
             results = []
-            processed = 0
             # Use strict_attachment_filter for client-side filtering if provided
             client_filter = strict_attachment_filter or attachment_filter
-            for msg_id in message_ids:
-                email_data = self._parse_email(msg_id, target_sender, client_filter)
+            for msg_id, raw_email in self._fetch_messages(message_ids):
+                email_data = self._parse_raw_email(msg_id, raw_email, target_sender, client_filter)
                 if email_data and email_data.has_attachments():
                     results.append(email_data)
 
@@ -202,17 +204,49 @@ class GmailRepository:
 
         return filtered
 
-    def _parse_email(
+    def _fetch_messages(self, message_ids: list) -> List[Tuple[bytes, bytes]]:
+        """
+        Fetch full messages using one FETCH command per batch of IDs.
+
+        Args:
+            message_ids: List of IMAP message IDs
+
+        Returns:
+            List of (message_id, raw_email) tuples
+        """
+        messages = []
+
+        for start in range(0, len(message_ids), self.FETCH_BATCH_SIZE):
+            batch = message_ids[start:start + self.FETCH_BATCH_SIZE]
+            try:
+                status, data = self.mail.fetch(b",".join(batch), "(RFC822)")
+                if status != "OK":
+                    logger.warning(f"批次獲取郵件失敗: {status}")
+                    continue
+
+                # Response is [(b"<id> (RFC822 {size}", raw), b")", ...]
+                for item in data:
+                    if isinstance(item, tuple):
+                        messages.append((item[0].split()[0], item[1]))
+
+            except Exception as e:
+                logger.error(f"批次獲取郵件時發生錯誤: {e}")
+
+        return messages
+
+    def _parse_raw_email(
         self,
         message_id: bytes,
+        raw_email: bytes,
         target_sender: str,
         attachment_filter: Optional[str] = None
     ) -> Optional[EmailData]:
         """
-        Parse a single email message.
+        Parse an already fetched email message.
 
         Args:
             message_id: IMAP message ID
+            raw_email: Raw RFC822 message bytes
             target_sender: Expected sender email address
             attachment_filter: Optional string to filter attachment filenames
 
@@ -220,11 +254,6 @@ class GmailRepository:
             EmailData if email matches criteria, None otherwise
         """
         try:
-            status, data = self.mail.fetch(message_id, "(RFC822)")
-            if status != "OK":
-                return None
-
-            raw_email = data[0][1]
             email_message = email.message_from_bytes(raw_email)
 
             # Parse sender
@@ -282,8 +311,7 @@ class GmailRepository:
             return attachments
 
         for part in email_message.walk():
-            content_disposition = str(part.get("Content-Disposition"))
-            if "attachment" not in content_disposition:
+            if part.get_content_disposition() != "attachment":
                 continue
 
             filename = part.get_filename()
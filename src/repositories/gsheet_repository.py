@@ -4,8 +4,9 @@ Google Sheets repository for spreadsheet operations.
 import pandas as pd
 from typing import List, Dict, Optional, Any
 from loguru import logger
+from pygsheets.utils import format_addr
 
-from src.google_drive import C2CGoogleSheet
+from src.google_drive import C2CGoogleSheet, a1_range
 from src.config.config import ConfigManager
 
 
@@ -114,22 +115,25 @@ class GoogleSheetRepository:
         self,
         worksheet,
         df: pd.DataFrame,
+        current_values: Optional[List[List[Any]]] = None,
         protected_columns: int = 12
     ) -> bool:
         """
         Update worksheet with DataFrame data.
-        Only updates columns after protected_columns.
+        Only updates columns after protected_columns, and only sends the
+        cells that differ from current_values in one batchUpdate request.
 
         Args:
             worksheet: Worksheet to update
             df: DataFrame with data
+            current_values: Values currently in the sheet (re-read if not provided)
             protected_columns: Number of columns to protect (default 12)
 
         Returns:
             True if successful, False otherwise
         """
         try:
-            return self.drive.update_worksheet(worksheet, df)
+            return self.drive.update_worksheet(worksheet, df, current_values)
         except Exception as e:
             logger.error(f"更新工作表失敗: {e}")
             return False
@@ -157,20 +161,23 @@ class GoogleSheetRepository:
                 return False
 
             required_rows = len(source_data)
-            required_cols = len(source_data[0]) if source_data else 0
+            required_cols = max(len(row) for row in source_data)
+            source_data = [list(row) + [""] * (required_cols - len(row)) for row in source_data]
 
-            # Expand worksheet if needed
+            # The backup sheet is shared by several sheets: resize it to exactly this
+            # snapshot so rows/columns left from a larger earlier backup are dropped
             current_rows = backup_worksheet.rows
             current_cols = backup_worksheet.cols
 
-            if required_rows > current_rows or required_cols > current_cols:
-                logger.info(f"擴展備份工作表: {current_rows}x{current_cols} -> {required_rows}x{required_cols}")
+            if (required_rows, required_cols) != (current_rows, current_cols):
+                logger.info(f"調整備份工作表大小: {current_rows}x{current_cols} -> {required_rows}x{required_cols}")
                 backup_worksheet.resize(rows=required_rows, cols=required_cols)
 
             # Update values
-            end_col = chr(64 + required_cols) if required_cols <= 26 else 'Z'
+            # format_addr handles columns past Z (AA, AB, ...)
+            end_cell = format_addr((required_rows, required_cols), "label")
             backup_worksheet.update_values(
-                crange=f"A1:{end_col}{required_rows}",
+                crange=f"A1:{end_cell}",
                 values=source_data
             )
 
@@ -181,47 +188,54 @@ class GoogleSheetRepository:
             logger.error(f"備份失敗: {e}")
             return False
 
-    def compare_row_counts(
+    @staticmethod
+    def count_valid_rows(data: List[List[Any]]) -> int:
+        """
+        Count rows that contain at least one non-empty cell.
+
+        Args:
+            data: 2D list of cell values
+
+        Returns:
+            Number of non-empty rows
+        """
+        return len([
+            row for row in data
+            if any(cell.strip() if isinstance(cell, str) else cell for cell in row)
+        ])
+
+    def verify_row_count(
         self,
-        sheet1_name: str,
-        sheet2_name: str
+        worksheet,
+        backup_sheet_name: str,
+        expected_count: int
     ) -> tuple[bool, str]:
         """
-        Compare row counts between two sheets.
+        Compare a worksheet's row count against the row count we backed up.
+
+        Only the target worksheet is re-read (one values.batchGet call, no
+        sheet reopen); the backup is never read back.
 
         Args:
-            sheet1_name: First sheet name
-            sheet2_name: Second sheet name
+            worksheet: Worksheet to verify
+            backup_sheet_name: Backup sheet name (for the message)
+            expected_count: Valid row count of the data written to the backup
 
         Returns:
             Tuple of (is_equal, message)
         """
         try:
-            # Get first sheet data
-            self.open_sheet(sheet1_name)
-            ws1 = self.get_worksheet(0)
-            data1 = self.get_all_values(ws1)
-
-            # Get second sheet data
-            self.open_sheet(sheet2_name)
-            ws2 = self.get_worksheet(0)
-            data2 = self.get_all_values(ws2)
-
-            # Filter empty rows
-            def count_valid_rows(data):
-                return len([
-                    row for row in data
-                    if any(cell.strip() if isinstance(cell, str) else cell for cell in row)
-                ])
-
-            count1 = count_valid_rows(data1)
-            count2 = count_valid_rows(data2)
+            sheet_name = worksheet.spreadsheet.title
+            data = self.drive.batch_get_values(worksheet.spreadsheet.id, [a1_range(worksheet.title)])[0]
+
+            count1 = self.count_valid_rows(data)
+            count2 = expected_count
 
             if count1 == count2:
-                msg = f"有效行數相同: {sheet1_name}={count1}行, {sheet2_name}={count2}行"
+                msg = f"有效行數相同: {sheet_name}={count1}行, {backup_sheet_name}={count2}行"
                 return True, msg
             else:
-                msg = f"有效行數不同: {sheet1_name}={count1}行, {sheet2_name}={count2}行"
+                msg = f"有效行數不同: {sheet_name}={count1}行, {backup_sheet_name}={count2}行"
                 return False, msg
 
         except Exception as e:
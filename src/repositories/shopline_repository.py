@@ -2,11 +2,14 @@
 ShopLine API repository for order operations.
 """
 import json
+import math
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, List, Any
 from loguru import logger
 
 from src.config.config import SettingsManager
+from src.utils.http import create_session
 
 
 class ShopLineRepository:
@@ -18,6 +21,9 @@ class ShopLineRepository:
     CUSTOM_DELIVERY_METHOD = "68281a2f3451b7000c4f5d7b"
     SHOPLINE_TCAT_DELIVERY_METHOD = "653a404c30939a000e82c000"
 
+    # Max result pages fetched at once
+    MAX_PAGE_WORKERS = 8
+
     def __init__(self, token: Optional[str] = None):
         """
         Initialize ShopLine repository.
@@ -33,6 +39,7 @@ class ShopLineRepository:
             "Content-Type": "application/json",
         }
         self.base_url = "https://open.shopline.io"
+        self.session = create_session(headers=self.headers)
 
     def _handle_response(self, response: requests.Response) -> Optional[Dict]:
         """
@@ -78,7 +85,7 @@ class ShopLineRepository:
             Order data or None
         """
         url = f"{self.base_url}/v1/orders/{order_id}"
-        response = requests.get(url=url, headers=self.headers)
+        response = self.session.get(url=url)
         return self._handle_response(response)
 
     def search_orders(self, conditions: Dict[str, Any]) -> Optional[Dict]:
@@ -93,21 +100,11 @@ class ShopLineRepository:
         """
         url = f"{self.base_url}/v1/orders/search"
 
-        # Build query string
-        query_params = []
-        for key, value in conditions.items():
-            if value is not None:
-                if isinstance(value, list):
-                    for item in value:
-                        query_params.append(f"{key}={item}")
-                else:
-                    query_params.append(f"{key}={value}")
-
-        query_string = "&".join(query_params)
-        full_url = f"{url}?{query_string}"
-
-        logger.debug(f"Search URL: {full_url}")
-        response = requests.get(url=full_url, headers=self.headers)
+        # requests encodes the query string; list values become repeated keys
+        params = {key: value for key, value in conditions.items() if value is not None}
+
+        response = self.session.get(url=url, params=params)
+        logger.trace("Search URL: {}", response.url)
         return self._handle_response(response)
 
     def query_order_by_number(self, order_number: str) -> Optional[Dict]:
@@ -153,37 +150,45 @@ class ShopLineRepository:
         }
         return self.search_orders(conditions)
 
-    def get_all_outstanding_orders(self) -> List[Dict]:
+    def get_all_outstanding_orders(self, per_page: int = 200) -> List[Dict]:
         """
         Get all outstanding orders (handles pagination).
+        The first page gives the page count; remaining pages are fetched concurrently.
+
+        Args:
+            per_page: Items per page
 
         Returns:
             List of all outstanding orders
         """
-        all_orders = []
-        page = 1
-        total_count = None
-
-        while True:
-            result = self.get_outstanding_orders(page=page)
-
-            if not result or "pagination" not in result:
-                logger.error(f"第 {page} 頁 API 響應無效")
-                break
-
-            if page == 1:
-                total_count = result["pagination"]["total_count"]
-                logger.info(f"待處理訂單總數: {total_count}")
-
-            items = result.get("items", [])
-            if items:
-                all_orders.extend(items)
-                logger.debug(f"第 {page} 頁獲取 {len(items)} 筆訂單")
-
-            if len(all_orders) >= total_count:
-                break
-
-            page += 1
+        result = self.get_outstanding_orders(page=1, per_page=per_page)
+        if not result or "pagination" not in result:
+            logger.error("第 1 頁 API 響應無效")
+            return []
+
+        pagination = result["pagination"]
+        total_count = pagination["total_count"]
+        total_pages = pagination.get("total_pages") or math.ceil(total_count / per_page)
+        logger.info(f"待處理訂單總數: {total_count}")
+
+        all_orders = list(result.get("items", []))
+
+        remaining_pages = list(range(2, total_pages + 1))
+        if remaining_pages:
+            max_workers = min(self.MAX_PAGE_WORKERS, len(remaining_pages))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                page_results = executor.map(
+                    lambda page: self.get_outstanding_orders(page=page, per_page=per_page),
+                    remaining_pages
+                )
+                for page, page_result in zip(remaining_pages, page_results):
+                    if not page_result or "pagination" not in page_result:
+                        logger.error(f"第 {page} 頁 API 響應無效")
+                        continue
+
+                    items = page_result.get("items", [])
+                    all_orders.extend(items)
+                    logger.debug(f"第 {page} 頁獲取 {len(items)} 筆訂單")
 
         logger.info(f"總共獲取 {len(all_orders)} 筆待處理訂單")
         return all_orders
@@ -212,7 +217,7 @@ class ShopLineRepository:
             "mail_notify": notify
         }
 
-        response = requests.patch(url=url, headers=self.headers, data=json.dumps(payload))
+        response = self.session.patch(url=url, json=payload)
         result = self._handle_response(response)
         return result is not None
 
@@ -240,7 +245,7 @@ class ShopLineRepository:
             "mail_notify": notify
         }
 
-        response = requests.patch(url=url, headers=self.headers, data=json.dumps(payload))
+        response = self.session.patch(url=url, json=payload)
         result = self._handle_response(response)
         return result is not None
 
@@ -272,7 +277,7 @@ class ShopLineRepository:
             },
         }
 
-        response = requests.patch(url=url, headers=self.headers, data=json.dumps(payload))
+        response = self.session.patch(url=url, json=payload)
         result = self._handle_response(response)
         return result is not None
 
@@ -2,11 +2,22 @@
 Tcat (黑貓宅急便) repository for delivery status queries.
 Wraps the existing tcat_scraping module.
 """
-from typing import Optional
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
 from loguru import logger
 
 from src.tcat_scraping import Tcat
 from src.config.config import ConfigManager
+from src.utils.sqlite_cache import SQLiteCache
+
+# Persistent cache of delivered statuses (project_root/.cache/tcat.sqlite by default)
+TCAT_CACHE_PATH = os.getenv(
+    "TCAT_CACHE_PATH",
+    str(Path(__file__).resolve().parents[2] / ".cache" / "tcat.sqlite")
+)
 
 
 class TcatRepository:
@@ -15,6 +26,21 @@ class TcatRepository:
     Encapsulates the web scraping logic.
     """
 
+    # Max concurrent requests to the Tcat site, across all callers (stays under the
+    # Tcat session's connection pool even when several sheets prefetch at once)
+    MAX_WORKERS = 16
+
+    # One shared pool for every instance/thread, created on first use
+    _executor: Optional[ThreadPoolExecutor] = None
+    _executor_lock = threading.Lock()
+
+    # Only delivered statuses are persisted (they no longer change); in-transit
+    # statuses are always re-scraped once clear_cache() starts a new run
+    DELIVERED_STATUS_TTL = 7 * 24 * 60 * 60
+
+    # Shared across instances and runs; None until first use, False if unavailable
+    _status_store = None
+
     def __init__(self):
         """Initialize Tcat repository."""
         self.config = ConfigManager()
@@ -31,14 +57,85 @@ class TcatRepository:
         Returns:
             Status string (e.g., "已集貨", "順利送達", "尚無資料")
         """
+        cached_status = self._get_stored_status(tracking_number)
+        if cached_status is not None:
+            return cached_status
+
         try:
             status = Tcat.order_status(tracking_number)
-            logger.debug(f"黑貓單號 {tracking_number} 狀態: {status}")
-            return status
+            logger.trace("黑貓單號 {} 狀態: {}", tracking_number, status)
         except Exception as e:
             logger.error(f"查詢黑貓狀態失敗 {tracking_number}: {e}")
             return self.no_data_status
 
+        if self.is_delivered(status):
+            self._store_status(tracking_number, status)
+        return status
+
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        """Get the process-wide Tcat lookup pool."""
+        with cls._executor_lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(max_workers=cls.MAX_WORKERS, thread_name_prefix="tcat")
+            return cls._executor
+
+    @classmethod
+    def _get_status_store(cls) -> Optional[SQLiteCache]:
+        """Open the persistent status cache once; disable it if the file can't be used."""
+        if cls._status_store is None:
+            try:
+                cls._status_store = SQLiteCache(TCAT_CACHE_PATH, table="tcat_status")
+            except Exception as e:
+                logger.warning(f"無法開啟黑貓狀態快取 {TCAT_CACHE_PATH}: {e}")
+                cls._status_store = False
+        return cls._status_store or None
+
+    def _get_stored_status(self, tracking_number: str) -> Optional[str]:
+        """Return a persisted delivered status if it is still fresh enough to reuse."""
+        store = self._get_status_store()
+        if store is None:
+            return None
+        try:
+            cached = store.get(tracking_number)
+        except Exception as e:
+            logger.warning(f"讀取黑貓狀態快取失敗 {tracking_number}: {e}")
+            return None
+        if cached is None:
+            return None
+
+        status, age = cached
+        if not self.is_delivered(status) or age >= self.DELIVERED_STATUS_TTL:
+            return None
+        return status
+
+    def _store_status(self, tracking_number: str, status: str) -> None:
+        """Persist a delivered status for later runs."""
+        store = self._get_status_store()
+        if store is None:
+            return
+        try:
+            store.set(tracking_number, status)
+        except Exception as e:
+            logger.warning(f"寫入黑貓狀態快取失敗 {tracking_number}: {e}")
+
+    def get_order_statuses(self, tracking_numbers: Iterable[str]) -> Dict[str, str]:
+        """
+        Get delivery statuses for many tracking numbers concurrently.
+
+        Args:
+            tracking_numbers: Tcat tracking numbers (duplicates are queried once)
+
+        Returns:
+            Dict of {tracking_number: status}
+        """
+        unique_numbers = list(dict.fromkeys(tracking_numbers))
+        if not unique_numbers:
+            return {}
+
+        statuses = self._get_executor().map(self.get_order_status, unique_numbers)
+        return dict(zip(unique_numbers, statuses))
+
     def get_collected_time(
         self,
         tracking_number: str,
@@ -59,13 +156,31 @@ class TcatRepository:
                 tracking_number,
                 current_state=current_status
             )
-            if collected_time:
-                logger.debug(f"黑貓單號 {tracking_number} 集貨時間: {collected_time}")
             return collected_time
         except Exception as e:
             logger.error(f"查詢集貨時間失敗 {tracking_number}: {e}")
             return None
 
+    def get_collected_times(
+        self,
+        lookups: Iterable[Tuple[str, Optional[str]]]
+    ) -> Dict[Tuple[str, Optional[str]], Optional[str]]:
+        """
+        Get collection times for many tracking numbers concurrently.
+
+        Args:
+            lookups: (tracking_number, current_status) pairs (duplicates are queried once)
+
+        Returns:
+            Dict of {(tracking_number, current_status): collection time or None}
+        """
+        unique_lookups = list(dict.fromkeys(lookups))
+        if not unique_lookups:
+            return {}
+
+        collected_times = self._get_executor().map(lambda lookup: self.get_collected_time(*lookup), unique_lookups)
+        return dict(zip(unique_lookups, collected_times))
+
     def get_status_update_time(self, tracking_number: str) -> Optional[str]:
         """
         Get the last status update time.
@@ -83,6 +198,16 @@ class TcatRepository:
             logger.error(f"查詢更新時間失敗 {tracking_number}: {e}")
             return None
 
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        Clear the per-run Tcat caches so the next lookups hit the site again.
+
+        Delivered statuses kept in the persistent store (TCAT_CACHE_PATH) are
+        still reused, since a delivered parcel's status no longer changes.
+        """
+        Tcat.clear_cache()
+
     @staticmethod
     def get_tracking_url(tracking_number: str) -> str:
         """
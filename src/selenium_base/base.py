@@ -26,11 +26,15 @@ class Component:
 
 class BaseHandler:
     timeout = 5
+    # Seconds between explicit-wait checks
+    poll_frequency = 0.1
 
     def __init__(self) -> None:
         options = Options()
         options.add_experimental_option("debuggerAddress", "127.0.0.1:9527")
         self.driver = webdriver.Chrome(options=options)
+        # Explicit waits only; an implicit wait would stack onto every poll
+        self.driver.implicitly_wait(0)
         self.url = self.driver.current_url
         print(self.url)
 
@@ -61,7 +65,7 @@ class BaseHandler:
         if self.__iswebelement(loc):
             return loc
         try:
-            return WebDriverWait(self.driver, self.timeout, 1).until(EC.presence_of_element_located(loc.locator))
+            return WebDriverWait(self.driver, self.timeout, self.poll_frequency).until(EC.presence_of_element_located(loc.locator))
         except (NoSuchElementException, TimeoutException):
             logger.warning(f"{loc.desc} element is not found")
             raise NoSuchElementException(f"' {loc.desc} ' element is not found. ")
@@ -71,7 +75,7 @@ class BaseHandler:
             return loc
         try:
             if wait:
-                return WebDriverWait(self.driver, self.timeout, 1).until(EC.presence_of_all_elements_located(loc.locator))
+                return WebDriverWait(self.driver, self.timeout, self.poll_frequency).until(EC.presence_of_all_elements_located(loc.locator))
             return self.driver.find_elements(*loc.locator)
         except (NoSuchElementException, TimeoutException):
             logger.warning(f"{loc.desc} element is not found")
@@ -83,7 +87,7 @@ class BaseHandler:
 
         WebDriverWait(self.driver, timeout).until(_check_attribute_removed)
 
-    def wait_for_element(self, loc, child_loc=None, wait_type="presence", timeout=None, poll_frequency=0.5):
+    def wait_for_element(self, loc, child_loc=None, wait_type="presence", timeout=None, poll_frequency=None):
         """
         Waits for a specific condition to be met for an element or elements.
 
@@ -99,11 +103,13 @@ class BaseHandler:
         - "visibility_of": Wait for a WebElement to be visible (only for WebElements, not locators).
 
         :param timeout: The maximum time to wait for the condition to be met. Defaults to the class-level `timeout` attribute if not provided.
-        :param poll_frequency: The frequency (in seconds) with which to poll for the condition. Default is 1 second.
+        :param poll_frequency: The frequency (in seconds) with which to poll for the condition. Defaults to the class-level `poll_frequency` attribute if not provided.
         :return: The WebElement or a list of WebElements that meet the condition.
         """
         if timeout is None:
             timeout = self.timeout
+        if poll_frequency is None:
+            poll_frequency = self.poll_frequency
         wait_conditions = {
             "presence_all": EC.presence_of_all_elements_located,  # For locator only. -> return list
             "presence": EC.presence_of_element_located,  # For locator only.
@@ -135,14 +141,14 @@ class BaseHandler:
     def find_child_element(self, loc, child_loc, *args, **kwargs):
         ele = self.find_element(loc=loc)
         try:
-            return WebDriverWait(ele, self.timeout, 1).until(EC.presence_of_element_located(child_loc.locator))
+            return WebDriverWait(ele, self.timeout, self.poll_frequency).until(EC.presence_of_element_located(child_loc.locator))
         except:
             raise NoSuchElementException(f"' {child_loc.desc} ' element is not found. ")
 
     def find_child_elements(self, loc, child_loc, *args, **kwargs):
         ele = self.find_element(loc=loc)
         try:
-            return WebDriverWait(ele, self.timeout, 1).until(EC.presence_of_all_elements_located(child_loc.locator))
+            return WebDriverWait(ele, self.timeout, self.poll_frequency).until(EC.presence_of_all_elements_located(child_loc.locator))
         except:
             raise NoSuchElementException(f"' {child_loc.desc} ' element is not found. ")
 
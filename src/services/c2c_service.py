@@ -1,8 +1,11 @@
 """
 C2C order service for Google Sheet operations.
 """
+import threading
 import pandas as pd
-from typing import Dict, List, Optional, Tuple
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 from loguru import logger
 
 from src.repositories.gsheet_repository import GoogleSheetRepository
@@ -15,6 +18,17 @@ class C2CService:
     Service for C2C order management in Google Sheets.
     """
 
+    # Max sheets processed at once (kept low for Sheets API rate limits)
+    MAX_SHEET_WORKERS = 4
+
+    # All target sheets share one backup sheet, so backup -> update -> verify must not interleave
+    _write_lock = threading.Lock()
+
+    # One lock per target sheet: concurrent runs (e.g. several dates) must not read, compute
+    # and write the same sheet at once, or the later write would overwrite the earlier one
+    _sheet_locks: Dict[str, threading.Lock] = {}
+    _sheet_locks_guard = threading.Lock()
+
     def __init__(self):
         """Initialize C2C service."""
         self.gsheet_repo = GoogleSheetRepository()
@@ -41,6 +55,33 @@ class C2CService:
         """
         return self.gsheet_repo.find_c2c_sheets()
 
+    def process_sheets(
+        self,
+        sheet_names: List[str],
+        email_orders: Dict[str, Dict]
+    ) -> List[Tuple[str, int, Optional[str]]]:
+        """
+        Process multiple C2C sheets concurrently.
+
+        Google API clients are not thread-safe, so each worker uses its own C2CService.
+
+        Args:
+            sheet_names: Names of the sheets to process
+            email_orders: Dict of {order_number: {status, tcat_number}} from email
+
+        Returns:
+            List of (sheet_name, update_count, error_message or None), in input order
+        """
+        if len(sheet_names) <= 1:
+            return [(name, *self.process_sheet(name, email_orders)) for name in sheet_names]
+
+        def _process_one(sheet_name: str) -> Tuple[str, int, Optional[str]]:
+            return (sheet_name, *C2CService().process_sheet(sheet_name, email_orders))
+
+        max_workers = min(self.MAX_SHEET_WORKERS, len(sheet_names))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_process_one, sheet_names))
+
     def process_sheet(
         self,
         sheet_name: str,
@@ -49,6 +90,32 @@ class C2CService:
         """
         Process a single C2C sheet with order updates.
 
+        The whole read -> compute -> write step holds the sheet's lock.
+
+        Args:
+            sheet_name: Name of the sheet to process
+            email_orders: Dict of {order_number: {status, tcat_number}} from email
+
+        Returns:
+            Tuple of (update_count, error_message or None)
+        """
+        with self._sheet_lock(sheet_name):
+            return self._process_sheet(sheet_name, email_orders)
+
+    @classmethod
+    def _sheet_lock(cls, sheet_name: str) -> threading.Lock:
+        """Get (or create) the lock for one target sheet."""
+        with cls._sheet_locks_guard:
+            return cls._sheet_locks.setdefault(sheet_name, threading.Lock())
+
+    def _process_sheet(
+        self,
+        sheet_name: str,
+        email_orders: Dict[str, Dict]
+    ) -> Tuple[int, Optional[str]]:
+        """
+        Read a C2C sheet, stage its order updates and write them back.
+
         Args:
             sheet_name: Name of the sheet to process
             email_orders: Dict of {order_number: {status, tcat_number}} from email
@@ -67,43 +134,66 @@ class C2CService:
             if not all_values:
                 return 0, "工作表為空"
 
-            # Backup first
-            backup_name = self.config.flowdite_backup_sheet
-            if not self._backup_sheet(all_values, backup_name):
-                return 0, "備份失敗"
-
-            # Reopen original sheet
-            self.gsheet_repo.open_sheet(sheet_name)
-            worksheet = self.gsheet_repo.get_worksheet(0)
-
             # Convert to DataFrame
             df = self._values_to_dataframe(all_values)
 
-            # Process each row
-            update_count = 0
-            for index, row in df.iterrows():
-                order_number = row.get(self.order_number_field)
-                if pd.isna(order_number) or not str(order_number).strip():
-                    continue
+            # Column positions in itertuples() output (position 0 is the index)
+            fields = (self.order_number_field, self.delivery_number_field, self.status_field, self.shipping_date_field)
+            positions = {field: df.columns.get_loc(field) + 1 for field in fields if field in df.columns}
 
-                updated = self._process_row(df, index, row, email_orders)
+            # Process candidate rows (Tcat lookups only, no sheet writes)
+            update_count = 0
+            pending_updates: Dict[int, Dict[str, Any]] = defaultdict(dict)
+            candidates = df[self._rows_to_process(df, email_orders)]
+
+            # Fill missing tracking numbers from the email orders in one vectorized write
+            email_tcat_numbers = self._email_tcat_numbers(candidates, email_orders)
+            if not email_tcat_numbers.empty:
+                df.loc[email_tcat_numbers.index, self.delivery_number_field] = email_tcat_numbers
+                logger.debug(f"從郵件補上 {len(email_tcat_numbers)} 筆黑貓單號")
+
+            # Query Tcat for all rows concurrently; the per-row lookups below hit Tcat's run cache
+            self._prefetch_tcat(candidates)
+
+            if self.shipping_date_field in candidates.columns:
+                # Normalize shipping dates in one pass ("" means not shipped yet)
+                shipping_dates = candidates[self.shipping_date_field].str.strip()
+                candidates = candidates.assign(**{self.shipping_date_field: shipping_dates})
+            for values in candidates.itertuples(index=True, name=None):
+                row = {field: values[pos] for field, pos in positions.items()}
+                updated = self._process_row(pending_updates, values[0], row, email_orders)
                 if updated:
                     update_count += 1
 
-            # Update sheet if changes were made
-            if update_count > 0:
-                if self.gsheet_repo.update_worksheet(worksheet, df):
-                    # Verify backup
-                    is_equal, msg = self.gsheet_repo.compare_row_counts(
-                        sheet_name, backup_name
-                    )
-                    if not is_equal:
-                        logger.warning(f"行數驗證警告: {msg}")
+            logger.info(f"{sheet_name} 檢查 {len(candidates)} 筆, 需更新 {update_count} 筆")
 
-                    logger.success(f"成功更新 {update_count} 筆資料")
-                else:
+            # Apply all staged cell changes in one vectorized write
+            if pending_updates:
+                df.update(pd.DataFrame.from_dict(pending_updates, orient="index"))
+
+            # Nothing to write: skip the backup copy as well
+            if update_count == 0:
+                logger.info(f"{sheet_name} 沒有需要更新的資料，略過備份")
+                return 0, None
+
+            with self._write_lock:
+                # Backup the original values first
+                backup_name = self.config.flowdite_backup_sheet
+                if not self._backup_sheet(all_values, backup_name):
+                    return 0, "備份失敗"
+
+                if not self.gsheet_repo.update_worksheet(worksheet, df, all_values):
                     return update_count, "更新工作表失敗"
 
+                # Verify backup
+                is_equal, msg = self.gsheet_repo.verify_row_count(
+                    worksheet, backup_name, self.gsheet_repo.count_valid_rows(all_values)
+                )
+                if not is_equal:
+                    logger.warning(f"行數驗證警告: {msg}")
+
+                logger.success(f"成功更新 {update_count} 筆資料")
+
             return update_count, None
 
         except Exception as e:
@@ -120,13 +210,100 @@ class C2CService:
         header_count = len(header)
         data = [row[:header_count] for row in values[1:]]
         df = pd.DataFrame(data, columns=header)
+
+        # Key columns as string dtype ("" for missing cells) so the masks use vectorized string ops
+        fields = (self.order_number_field, self.delivery_number_field, self.status_field, self.shipping_date_field)
+        dtypes = {field: "string" for field in fields if field in df.columns}
+        df[list(dtypes)] = df[list(dtypes)].fillna("")
+        df = df.astype(dtypes)
         return df.reset_index(drop=True)
 
+    def _rows_to_process(self, df: pd.DataFrame, email_orders: Dict[str, Dict]) -> pd.Series:
+        """
+        Build a boolean mask of rows that may need an update.
+
+        A row is a candidate if it has an order number and either already has
+        a tracking number or can get one from the email orders. Delivered rows
+        that already have a shipping date are final and skipped as well, so
+        they never reach the Tcat lookups.
+
+        Args:
+            df: Sheet DataFrame
+            email_orders: Email order data
+
+        Returns:
+            Boolean Series aligned with df
+        """
+        order_numbers = df[self.order_number_field].str.strip()
+        tcat_numbers = df[self.delivery_number_field].str.strip()
+
+        has_order = order_numbers.ne("")
+        has_tcat = tcat_numbers.ne("")
+        in_email = order_numbers.isin(list(email_orders))
+
+        skipped = has_order & ~has_tcat & ~in_email
+        if skipped.any():
+            logger.debug(f"逢泰excel中未更新 {int(skipped.sum())} 筆單號")
+
+        candidates = has_order & (has_tcat | in_email)
+
+        # Delivered with a shipping date: nothing left to update
+        if self.shipping_date_field in df.columns:
+            delivered = df[self.status_field].eq(self.success_status)
+            has_shipping_date = df[self.shipping_date_field].str.strip().ne("")
+            candidates &= ~(has_tcat & delivered & has_shipping_date)
+
+        return candidates
+
+    def _email_tcat_numbers(self, df: pd.DataFrame, email_orders: Dict[str, Dict]) -> pd.Series:
+        """
+        Look up tracking numbers from the email orders for rows that have none.
+
+        Args:
+            df: Sheet DataFrame (or a subset of its rows)
+            email_orders: Email order data
+
+        Returns:
+            Series of tracking numbers indexed like df, only for rows that got one
+        """
+        order_numbers = df[self.order_number_field].str.strip()
+        missing = df[self.delivery_number_field].str.strip().eq("") & order_numbers.isin(list(email_orders))
+
+        tcat_numbers = order_numbers[missing].map(lambda order_number: email_orders[order_number].get("tcat_number"))
+        return tcat_numbers[tcat_numbers.fillna("").ne("")]
+
+    def _prefetch_tcat(self, df: pd.DataFrame) -> None:
+        """
+        Warm Tcat's run cache for the rows about to be processed.
+
+        Statuses are fetched for undelivered rows, then collected times for
+        rows that still lack a shipping date, each batch concurrently.
+
+        Args:
+            df: Candidate rows
+        """
+        tcat_numbers = df[self.delivery_number_field].str.strip()
+        has_tcat = tcat_numbers.ne("")
+        delivered = df[self.status_field].eq(self.success_status)
+        statuses = self.tcat_repo.get_order_statuses(tcat_numbers[has_tcat & ~delivered])
+
+        if self.shipping_date_field not in df.columns:
+            return
+
+        # Same (tracking_number, new_status) pairs _update_status_value will ask for
+        missing_date = has_tcat & df[self.shipping_date_field].str.strip().eq("")
+        lookups = []
+        for tcat_number, is_delivered in zip(tcat_numbers[missing_date], delivered[missing_date]):
+            status = self.success_status if is_delivered else statuses[tcat_number]
+            if status != self.no_data_status:
+                lookups.append((tcat_number, status))
+        self.tcat_repo.get_collected_times(lookups)
+
     def _process_row(
         self,
-        df: pd.DataFrame,
+        updates: Dict[int, Dict[str, Any]],
         index: int,
-        row: pd.Series,
+        row: Dict[str, Any],
         email_orders: Dict[str, Dict]
     ) -> bool:
         """
@@ -138,9 +315,9 @@ class C2CService:
         3. If no tcat_number -> try to get from email orders
 
         Args:
-            df: DataFrame to update
+            updates: Staged changes as {index: {field: value}}
             index: Row index
-            row: Row data
+            row: Row data as {field: value}
             email_orders: Email order data
 
         Returns:
@@ -153,112 +330,104 @@ class C2CService:
         # Case 1: Has tcat_number and already delivered
         # Legacy behavior: still call status_update to potentially fill shipping date
         if pd.notna(tcat_number) and str(tcat_number).strip() and current_status == self.success_status:
-            return self._update_status_value(df, index, row, self.success_status)
+            return self._update_status_value(updates, index, row, self.success_status)
 
         # Case 2: Has tcat_number but not delivered - query Tcat and update
         if pd.notna(tcat_number) and str(tcat_number).strip():
             tcat_number = str(tcat_number).strip()
-            return self._update_status(df, index, row, tcat_number)
+            return self._update_status(updates, index, row, tcat_number)
 
-        # Case 3: No tcat_number - try to get from email
+        # Case 3: No tcat_number - use the email status (tracking number already filled by process_sheet)
         if order_number in email_orders:
             order_info = email_orders[order_number]
-            new_tcat_number = order_info.get("tcat_number")
-            status = order_info.get("status")
-
-            if new_tcat_number:
-                df.loc[index, self.delivery_number_field] = new_tcat_number
-                logger.debug(f"更新 {order_number} 的黑貓單號: {new_tcat_number}")
-                return self._update_status_value(df, index, row, status)
-        else:
-            logger.debug(f"逢泰excel中未更新此單號: {order_number}")
+            if order_info.get("tcat_number"):
+                return self._update_status_value(updates, index, row, order_info.get("status"))
 
         return False
 
     def _update_status(
         self,
-        df: pd.DataFrame,
+        updates: Dict[int, Dict[str, Any]],
         index: int,
-        row: pd.Series,
+        row: Dict[str, Any],
         tcat_number: str
     ) -> bool:
         """
         Update status by querying Tcat.
 
         Args:
-            df: DataFrame to update
+            updates: Staged changes as {index: {field: value}}
             index: Row index
-            row: Row data
+            row: Row data as {field: value}
             tcat_number: Tracking number
 
         Returns:
             True if updated
         """
         new_status = self.tcat_repo.get_order_status(tcat_number)
-        return self._update_status_value(df, index, row, new_status)
+        return self._update_status_value(updates, index, row, new_status)
 
     def _update_status_value(
         self,
-        df: pd.DataFrame,
+        updates: Dict[int, Dict[str, Any]],
         index: int,
-        row: pd.Series,
+        row: Dict[str, Any],
         new_status: str
     ) -> bool:
         """
-        Apply status update to DataFrame.
+        Stage a status update for a row.
 
         Logic matches legacy c2c_main.py status_update() method:
         - If new_status is "尚無資料", clear shipping date if it exists
         - Otherwise, update status and try to fill shipping date
 
         Args:
-            df: DataFrame to update
+            updates: Staged changes as {index: {field: value}}
             index: Row index
-            row: Row data
+            row: Row data as {field: value}
             new_status: New status value
 
         Returns:
             True if updated
         """
         tcat_number = row.get(self.delivery_number_field)
+        # Already stripped by process_sheet; "" or None means no shipping date
         shipping_date = row.get(self.shipping_date_field)
 
         # Legacy behavior: when status is "尚無資料", clear shipping date
         if new_status == self.no_data_status:
-            logger.debug(f"暫無 {tcat_number} 訂單的狀態")
+            logger.trace("暫無 {} 訂單的狀態", tcat_number)
             # Clear shipping date if it has value (legacy behavior)
-            if pd.notna(shipping_date) and str(shipping_date).strip():
-                df.loc[index, self.shipping_date_field] = ""
+            if shipping_date:
+                updates[index][self.shipping_date_field] = ""
             return False
 
         current_status = row.get(self.status_field)
         updated = False
 
         # Update status if different, or update shipping date if empty
-        if current_status != new_status or pd.isna(shipping_date) or not str(shipping_date).strip():
+        if current_status != new_status or not shipping_date:
             # Update status if different
             if current_status != new_status:
-                df.loc[index, self.status_field] = new_status
-                logger.debug(f"更新 {tcat_number} 的狀態 {new_status}")
+                updates[index][self.status_field] = new_status
+                logger.trace("更新 {} 的狀態 {}", tcat_number, new_status)
                 updated = True
 
             # Update shipping date if empty
-            if pd.isna(shipping_date) or not str(shipping_date).strip():
+            if not shipping_date:
                 if pd.notna(tcat_number):
                     collected_time = self.tcat_repo.get_collected_time(
                         str(tcat_number).strip(),
                         current_status=new_status
                     )
                     if collected_time:
-                        df.loc[index, self.shipping_date_field] = collected_time
-                        logger.debug(f"更新 {tcat_number} 的集貨時間 {collected_time}")
+                        updates[index][self.shipping_date_field] = collected_time
+                        logger.trace("更新 {} 的集貨時間 {}", tcat_number, collected_time)
                         return True
                     else:
                         logger.warning(f"未找到 {tcat_number} 的集貨時間")
                         return updated
                 return True
-        else:
-            logger.debug(f"無須更新 {tcat_number} 資料")
 
         return updated
 
@@ -275,18 +444,21 @@ class C2CService:
         Returns:
             Dict of {order_number: {status, tcat_number}}
         """
-        result = {}
+        valid_orders = [
+            (order.get("order_number"), order.get("tcat_number"))
+            for order in orders
+            if order.get("order_number") and order.get("tcat_number")
+        ]
 
-        for order in orders:
-            order_number = order.get("order_number")
-            tcat_number = order.get("tcat_number")
+        # Query all tracking numbers concurrently
+        statuses = self.tcat_repo.get_order_statuses(tcat_number for _, tcat_number in valid_orders)
 
-            if order_number and tcat_number:
-                status = self.tcat_repo.get_order_status(tcat_number)
-                result[order_number] = {
-                    "status": status,
-                    "tcat_number": tcat_number
-                }
+        result = {}
+        for order_number, tcat_number in valid_orders:
+            result[order_number] = {
+                "status": statuses[tcat_number],
+                "tcat_number": tcat_number
+            }
 
         logger.info(f"建立 {len(result)} 筆訂單狀態")
         return result
@@ -3,9 +3,11 @@ Email service for fetching and processing emails.
 """
 
 import io
+import zipfile
 import pandas as pd
-from typing import List, Dict, Optional, Tuple
-from datetime import datetime
+from openpyxl import load_workbook
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+from datetime import datetime, timedelta
 from loguru import logger
 
 from src.repositories.gmail_repository import GmailRepository
@@ -46,6 +48,34 @@ class EmailService:
 
         return emails
 
+    def fetch_flowtide_emails_range(self, start_date: datetime, end_date: datetime) -> List[EmailData]:
+        """
+        Fetch Flowtide Excel emails for a date range with a single IMAP search.
+
+        Args:
+            start_date: First date to fetch (inclusive)
+            end_date: Last date to fetch (inclusive)
+
+        Returns:
+            List of EmailData objects with Flowtide attachments
+        """
+        with self.gmail_repo as repo:
+            emails = repo.fetch_emails_by_date(
+                target_sender=self.config.flowtide_sender_email,
+                since_date=start_date,
+                before_date=end_date + timedelta(days=1),
+                attachment_filter="A442",
+                strict_attachment_filter="A442_QC_",
+            )
+
+        range_str = f"{start_date.strftime('%d-%b-%Y')} ~ {end_date.strftime('%d-%b-%Y')}"
+        if emails:
+            logger.success(f"收到逢泰 Excel ({range_str}), 共 {len(emails)} 封郵件")
+        else:
+            logger.warning(f"沒有收到逢泰 Excel ({range_str})")
+
+        return emails
+
     def extract_orders_from_emails(self, emails: List[EmailData], platform: str = "c2c") -> Tuple[List[Dict], int]:
         """
         Extract order information from email attachments.
@@ -57,62 +87,129 @@ class EmailService:
         Returns:
             Tuple of (list of order dicts, total order count)
         """
-        orders = []
-        total_count = 0
-        processed_tcat_numbers = set()
-
+        frames = []
         for email_data in emails:
             for attachment in email_data.attachments:
                 try:
-                    excel_orders, count = self._process_excel_attachment(attachment.content, platform, processed_tcat_numbers)
-                    orders.extend(excel_orders)
-                    total_count += count
+                    frames.append(self._read_platform_rows(attachment.content, platform))
                 except Exception as e:
                     logger.error(f"處理附件 {attachment.filename} 失敗: {e}")
 
-        logger.info(f"{platform.upper()} 訂單: 總計 {total_count} 筆, 黑貓單號 {len(processed_tcat_numbers)} 筆")
+        total_count = sum(len(frame) for frame in frames)
+        orders = self._extract_orders(pd.concat(frames, ignore_index=True), platform) if frames else []
+
+        logger.info(f"{platform.upper()} 訂單: 總計 {total_count} 筆, 黑貓單號 {len(orders)} 筆")
         return orders, total_count
 
-    def _process_excel_attachment(self, content: bytes, platform: str, processed_tcat_numbers: set) -> Tuple[List[Dict], int]:
+    def _extract_orders(self, df: pd.DataFrame, platform: str) -> List[Dict]:
         """
-        Process a single Excel attachment.
+        Build one order dict per tracking number from the rows of all attachments.
 
         Args:
-            content: Excel file content
-            platform: Platform to filter
-            processed_tcat_numbers: Set of already processed tracking numbers
+            df: Platform rows from every attachment
+            platform: Platform type
 
         Returns:
-            Tuple of (list of order dicts, order count)
+            List of order dicts, first occurrence of each tracking number
         """
-        file = io.BytesIO(content)
-        df = pd.read_excel(file, dtype={self.config.flowtide_order_number: str})
+        tcat_field = self.config.flowtide_tcat_number
+        if tcat_field not in df.columns:
+            return []
+
+        # Tracking numbers are read as text, so only blanks need dropping
+        tcat_numbers = df[tcat_field].astype("string").fillna("").str.strip()
+        valid = tcat_numbers.ne("")
+        pairs = pd.DataFrame({
+            "order_number": self._get_order_numbers(df[valid], platform),
+            "tcat_number": tcat_numbers[valid].astype(str),
+        })
+        pairs = pairs.drop_duplicates(subset="tcat_number")
+
+        return [
+            {"order_number": order_number, "tcat_number": tcat_number, "platform": platform}
+            for order_number, tcat_number in pairs.itertuples(index=False, name=None)
+        ]
+
+    def _read_platform_rows(self, content: bytes, platform: str) -> pd.DataFrame:
+        """
+        Read an Excel attachment keeping only the rows of one platform.
 
-        orders = []
-        count = 0
+        Rows are filtered while streaming, so the DataFrame only holds the
+        matching rows instead of the whole logistics dump.
 
-        for _, row in df.iterrows():
-            if not self._is_platform_order(row, platform):
-                continue
+        Args:
+            content: Excel file content
+            platform: Platform to filter
 
-            count += 1
-            order_number = self._get_order_number(row, platform)
-            tcat_number = row.get(self.config.flowtide_tcat_number)
+        Returns:
+            DataFrame of matching rows
+        """
+        columns = {
+            self.config.flowtide_mark_field,
+            self.config.flowtide_order_number,
+            self.config.flowtide_tcat_number,
+            self.config.flowtide_delivery_company,
+        }
+        rows = self._iter_excel_rows(content, columns)
+        header = next(rows, None)
+        if header is None:
+            return pd.DataFrame()
+
+        matched = [values for values in rows if self._is_platform_order(dict(zip(header, values)), platform)]
+        return pd.DataFrame(matched, columns=header)
+
+    def _iter_excel_rows(self, content: bytes, columns: Set[str]) -> Iterator[List[Any]]:
+        """
+        Iterate over selected columns of the first sheet, header row first.
 
-            if pd.notna(tcat_number):
-                tcat_number = str(int(tcat_number))
-                if tcat_number not in processed_tcat_numbers:
-                    processed_tcat_numbers.add(tcat_number)
-                    orders.append({"order_number": order_number, "tcat_number": tcat_number, "platform": platform})
+        xlsx files are streamed with openpyxl in read-only mode; legacy xls
+        files fall back to pandas (xlrd). Either way only the requested
+        columns are kept.
 
-        return orders, count
+        Args:
+            content: Excel file content
+            columns: Column names to keep (missing ones are ignored)
 
-    def _is_platform_order(self, row: pd.Series, platform: str) -> bool:
+        Yields:
+            Header row, then each data row as a list of cell values
+        """
+        file = io.BytesIO(content)
+        if not zipfile.is_zipfile(file):
+            text_columns = {self.config.flowtide_order_number: str, self.config.flowtide_tcat_number: str}
+            df = pd.read_excel(file, usecols=lambda col: str(col) in columns, dtype=text_columns)
+            yield [str(col) for col in df.columns]
+            yield from df.itertuples(index=False, name=None)
+            return
+
+        workbook = load_workbook(file, read_only=True, data_only=True)
+        try:
+            rows = workbook.worksheets[0].iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                return
+            header = ["" if col is None else str(col) for col in header]
+            positions = [i for i, col in enumerate(header) if col in columns]
+            selected = [header[i] for i in positions]
+            yield selected
+
+            text_fields = (self.config.flowtide_order_number, self.config.flowtide_tcat_number)
+            text_cols = [selected.index(field) for field in text_fields if field in selected]
+            for values in rows:
+                values = [values[i] if i < len(values) else None for i in positions]
+                # Match read_excel(dtype=str) for the order and tracking number columns
+                for col in text_cols:
+                    if values[col] is not None:
+                        values[col] = str(values[col])
+                yield values
+        finally:
+            workbook.close()
+
+    def _is_platform_order(self, row: Dict[str, Any], platform: str) -> bool:
         """
         Check if a row belongs to the specified platform.
 
         Args:
-            row: DataFrame row
+            row: Row data as {column: value}
             platform: Platform to check ("c2c" or "shopline")
 
         Returns:
@@ -131,23 +228,25 @@ class EmailService:
             logger.debug(f"檢查平台訂單失敗: {e}")
             return False
 
-    def _get_order_number(self, row: pd.Series, platform: str) -> str:
+    def _get_order_numbers(self, df: pd.DataFrame, platform: str) -> pd.Series:
         """
-        Extract order number from row.
+        Extract order numbers for all rows.
 
         Args:
-            row: DataFrame row
+            df: Flowtide rows
             platform: Platform type
 
         Returns:
-            Order number string
+            Series of order number strings aligned with df
         """
-        raw_number = str(row.get(self.config.flowtide_order_number, ""))
+        field = self.config.flowtide_order_number
+        if field not in df.columns:
+            return pd.Series("", index=df.index)
+
+        raw_numbers = df[field].astype(str)
 
-        if platform == "c2c":
-            return raw_number
-        elif platform == "shopline":
+        if platform == "shopline":
             # Remove # prefix
-            return raw_number.lstrip("#").split("-")[0]
+            return raw_numbers.str.lstrip("#").str.split("-").str[0]
 
-        return raw_number
+        return raw_numbers
@@ -209,51 +209,44 @@ class InventoryService:
         # 預設為當前時間
         return datetime.now()
 
-    def _is_defective_warehouse(self, warehouse_code: str) -> bool:
-        """
-        Check if warehouse code indicates defective stock.
-        Defective warehouses have format: xx-xx_不良品
-        """
-        if not warehouse_code:
-            return False
-        return '不良品' in str(warehouse_code)
-
     def _aggregate_by_product(self, df: pd.DataFrame) -> Dict[str, Dict]:
         """
         Aggregate inventory by product name.
         Same product with multiple batches should be summed.
         Separates normal stock from defective stock based on warehouse code (庫別).
         """
-        aggregated = {}
-
-        for _, row in df.iterrows():
-            name = str(row.get('品名', '')).strip()
-            if not name:
-                continue
-
-            period_end = float(row.get('期末', 0) or 0)
-            available = float(row.get('預計可用量', 0) or 0)
-            unit = str(row.get('單位', '個')).strip()
-            warehouse_code = str(row.get('庫別', '')).strip()
-
-            # Check if this is defective stock
-            is_defective = self._is_defective_warehouse(warehouse_code)
-
-            if name not in aggregated:
-                aggregated[name] = {
-                    'period_end': 0,      # 正常庫存
-                    'available': 0,
-                    'defective': 0,       # 不良品庫存
-                    'unit': unit,
-                }
-
-            if is_defective:
-                aggregated[name]['defective'] += period_end
-            else:
-                aggregated[name]['period_end'] += period_end
-                aggregated[name]['available'] += available
-
-        return aggregated
+        def numeric(column: str) -> pd.Series:
+            if column not in df.columns:
+                return pd.Series(0.0, index=df.index)
+            return pd.to_numeric(df[column], errors='coerce').fillna(0.0)
+
+        def text(column: str, default: str) -> pd.Series:
+            if column not in df.columns:
+                return pd.Series(default, index=df.index)
+            return df[column].astype(str).str.strip()
+
+        frame = pd.DataFrame({
+            'name': text('品名', ''),
+            'period_end': numeric('期末'),
+            'available': numeric('預計可用量'),
+            'unit': text('單位', '個'),
+            'warehouse': text('庫別', ''),
+        })
+        frame = frame[frame['name'] != ''].copy()
+
+        # Defective stock (庫別 xx-xx_不良品) is tracked separately from normal stock
+        is_defective = frame['warehouse'].str.contains('不良品', regex=False)
+        frame['defective'] = frame['period_end'].where(is_defective, 0.0)
+        frame['period_end'] = frame['period_end'].where(~is_defective, 0.0)
+        frame['available'] = frame['available'].where(~is_defective, 0.0)
+
+        aggregated = frame.groupby('name', sort=False).agg(
+            period_end=('period_end', 'sum'),
+            available=('available', 'sum'),
+            defective=('defective', 'sum'),
+            unit=('unit', 'first'),
+        )
+        return aggregated.to_dict(orient='index')
 
     def _categorize_product(self, name: str) -> InventoryCategory:
         """Categorize product by name."""
@@ -1,6 +1,7 @@
 """
 Notification service for LINE messages.
 """
+import threading
 from typing import Optional, List
 from loguru import logger
 from linebot.v3.messaging import Configuration, ApiClient, MessagingApi
@@ -20,6 +21,9 @@ class NotificationService:
         self.line_access_token = settings.line_access_token
         self.group_id = settings.group_id
         self._messages: List[str] = []
+        self._line_bot_api: Optional[MessagingApi] = None
+        # send_and_clear_async may push from a background thread while the caller sends
+        self._line_bot_api_lock = threading.Lock()
 
     def add_message(self, message: str) -> None:
         """
@@ -60,22 +64,32 @@ class NotificationService:
             logger.warning("沒有訊息可發送")
             return False
 
-        configuration = Configuration(access_token=self.line_access_token)
-
-        with ApiClient(configuration) as api_client:
-            line_bot_api = MessagingApi(api_client)
-            try:
-                push_request = PushMessageRequest(
-                    to=self.group_id,
-                    messages=[TextMessage(text=text)]
-                )
-                response = line_bot_api.push_message(push_request)
-                logger.success(f"LINE 訊息發送成功")
-                self.clear_messages()
-                return True
-            except Exception as e:
-                logger.error(f"LINE 訊息發送失敗: {e}")
-                return False
+        if self._push_text(text):
+            self.clear_messages()
+            return True
+        return False
+
+    def _push_text(self, text: str) -> bool:
+        """Push a text message to the LINE group."""
+        try:
+            push_request = PushMessageRequest(
+                to=self.group_id,
+                messages=[TextMessage(text=text)]
+            )
+            response = self._get_line_bot_api().push_message(push_request)
+            logger.success(f"LINE 訊息發送成功")
+            return True
+        except Exception as e:
+            logger.error(f"LINE 訊息發送失敗: {e}")
+            return False
+
+    def _get_line_bot_api(self) -> MessagingApi:
+        """Create the LINE API client on first use and reuse its connection pool afterwards."""
+        with self._line_bot_api_lock:
+            if self._line_bot_api is None:
+                configuration = Configuration(access_token=self.line_access_token)
+                self._line_bot_api = MessagingApi(ApiClient(configuration))
+            return self._line_bot_api
 
     def send_and_clear(self) -> bool:
         """
@@ -88,6 +102,25 @@ class NotificationService:
         self.clear_messages()
         return result
 
+    def send_and_clear_async(self) -> bool:
+        """
+        Send all queued messages in a background thread and clear the queue.
+
+        The thread is non-daemon, so the interpreter waits for the push
+        to finish before exiting.
+
+        Returns:
+            True if a send was started, False if there was nothing to send
+        """
+        text = self.get_combined_message()
+        self.clear_messages()
+        if not text:
+            logger.warning("沒有訊息可發送")
+            return False
+
+        threading.Thread(target=self._push_text, args=(text,), name="line-notify").start()
+        return True
+
     @property
     def has_messages(self) -> bool:
         """Check if there are queued messages."""
@@ -4,7 +4,10 @@ Sales Service
 """
 
 import io
+import multiprocessing
+import threading
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from typing import List, Dict, Tuple, Optional
 from datetime import datetime, timedelta
 from loguru import logger
@@ -13,6 +16,11 @@ from src.models.email_attachment import EmailData
 from src.repositories.supabase_repository import InventoryRepository
 
 
+def _init_parse_worker() -> None:
+    """解析子行程（spawn）只收集日誌交回主行程，不自行輸出到 stderr"""
+    logger.remove()
+
+
 class SalesService:
     """處理銷售資料的服務"""
 
@@ -27,11 +35,21 @@ class SalesService:
     BREAD_KEYWORDS = ['貝果', '歐包', '吐司', '麵包']
     BOX_KEYWORDS = ['紙箱', '禮盒', '包裝盒', '盒']
 
+    # 回填時每次 IMAP 搜尋涵蓋的天數
+    FETCH_RANGE_DAYS = 7
+
+    # 回填時同時抓取的日期區間數（Gmail IMAP 每帳號最多約 15 條連線）
+    FETCH_WORKERS = 8
+
+    # 回填時解析 Excel 的行程數（None = CPU 核心數）
+    PARSE_WORKERS = None
+
     def __init__(self):
         """初始化 Sales Service"""
         self.repo = InventoryRepository()
 
-    def parse_sales_excel(self, content: bytes, filename: str = "") -> Tuple[datetime, Dict[str, Dict]]:
+    @classmethod
+    def parse_sales_excel(cls, content: bytes, filename: str = "") -> Tuple[datetime, Dict[str, Dict]]:
         """
         解析銷售 Excel，彙總每個品項的實出量
 
@@ -52,9 +70,9 @@ class SalesService:
         logger.info(f"解析銷售 Excel: {filename}")
 
         try:
-            # 讀取 Excel
+            # 讀取 Excel（calamine 為原生解析器，xls/xlsx 皆支援）
             file = io.BytesIO(content)
-            df = pd.read_excel(file)
+            df = pd.read_excel(file, engine="calamine")
 
             logger.info(f"Excel 欄位: {list(df.columns)}")
             logger.info(f"總共 {len(df)} 列資料")
@@ -67,14 +85,14 @@ class SalesService:
                 raise ValueError(f"Excel 缺少必要欄位: {missing_columns}")
 
             # 提取銷售日期（從第一筆資料）
-            sale_date = self._extract_sale_date(df, filename)
+            sale_date = cls._extract_sale_date(df, filename)
             logger.info(f"銷售日期: {sale_date.strftime('%Y-%m-%d')}")
 
             # 移除空行
             df = df.dropna(subset=['品名'])
 
             # 彙總銷量
-            sales_data = self._aggregate_sales(df)
+            sales_data = cls._aggregate_sales(df)
             logger.success(f"解析完成，共 {len(sales_data)} 個品項")
 
             return sale_date, sales_data
@@ -83,7 +101,8 @@ class SalesService:
             logger.error(f"解析 Excel 失敗: {e}")
             raise
 
-    def _extract_sale_date(self, df: pd.DataFrame, filename: str) -> datetime:
+    @staticmethod
+    def _extract_sale_date(df: pd.DataFrame, filename: str) -> datetime:
         """
         提取銷售日期
 
@@ -132,7 +151,8 @@ class SalesService:
         logger.warning("無法從 Excel 或檔名取得日期，使用當前時間")
         return datetime.now()
 
-    def _aggregate_sales(self, df: pd.DataFrame) -> Dict[str, Dict]:
+    @classmethod
+    def _aggregate_sales(cls, df: pd.DataFrame) -> Dict[str, Dict]:
         """
         按品名彙總銷量
 
@@ -147,35 +167,26 @@ class SalesService:
                 }
             }
         """
-        sales_data = {}
+        product_names = df['品名'].astype(str).str.strip()
 
-        for _, row in df.iterrows():
-            product_name = str(row.get('品名', '')).strip()
-            if not product_name:
-                continue
+        # 取得實出量（銷量），無法轉成數字的視為 0
+        quantities = pd.to_numeric(df['實出量'], errors='coerce').fillna(0).astype(float)
 
-            # 取得實出量（銷量）
-            quantity = row.get('實出量', 0)
-            try:
-                quantity = float(quantity) if pd.notna(quantity) else 0
-            except (ValueError, TypeError):
-                quantity = 0
-
-            # 分類品項
-            category = self._categorize_product(product_name)
-
-            # 彙總同品名的銷量
-            if product_name not in sales_data:
-                sales_data[product_name] = {
-                    'quantity': 0,
-                    'category': category
-                }
+        # 彙總同品名的銷量（保留第一次出現的順序）
+        totals = quantities[product_names != ''].groupby(product_names, sort=False).sum()
 
-            sales_data[product_name]['quantity'] += quantity
+        sales_data = {
+            product_name: {
+                'quantity': quantity,
+                'category': cls._categorize_product(product_name)
+            }
+            for product_name, quantity in zip(totals.index, totals.tolist())
+        }
 
         return sales_data
 
-    def _categorize_product(self, product_name: str) -> str:
+    @classmethod
+    def _categorize_product(cls, product_name: str) -> str:
         """
         根據品名分類
 
@@ -188,11 +199,11 @@ class SalesService:
         name_lower = product_name.lower()
 
         # 檢查是否為盒子
-        if any(keyword in product_name for keyword in self.BOX_KEYWORDS):
+        if any(keyword in product_name for keyword in cls.BOX_KEYWORDS):
             return 'box'
 
         # 檢查是否為麵包
-        if any(keyword in product_name for keyword in self.BREAD_KEYWORDS):
+        if any(keyword in product_name for keyword in cls.BREAD_KEYWORDS):
             return 'bread'
 
         # 預設為麵包
@@ -345,7 +356,7 @@ class SalesService:
         dry_run: bool = False
     ) -> Tuple[int, int]:
         """
-        回填歷史銷量資料（逐日處理，節省記憶體）
+        回填歷史銷量資料（按日期區間並行抓取郵件，依序處理）
 
         Args:
             start_date: 開始日期
@@ -367,64 +378,114 @@ class SalesService:
         if dry_run:
             logger.info("[DRY RUN] 不會保存到資料庫")
 
-        email_service = EmailService()
         total_success = 0
         total_fail = 0
 
-        # 逐日處理：抓一天、處理一天、釋放記憶體
-        current_date = start_date
-
-        while current_date <= end_date:
-            date_str = current_date.strftime('%Y-%m-%d')
-            logger.info(f"處理日期: {date_str}")
+        # 每個執行緒使用自己的 EmailService（IMAP 連線不能跨執行緒共用）
+        thread_local = threading.local()
 
+        def _fetch(date_range: Tuple[datetime, datetime]):
+            email_service = getattr(thread_local, "email_service", None)
+            if email_service is None:
+                email_service = thread_local.email_service = EmailService()
             try:
-                # 抓取當天郵件
-                emails = email_service.fetch_flowtide_emails(current_date)
-
-                if not emails:
-                    logger.info(f"  {date_str}: 沒有找到郵件")
-                    current_date += timedelta(days=1)
-                    continue
-
-                logger.info(f"  {date_str}: 找到 {len(emails)} 封郵件")
-
-                # 處理當天郵件
-                for email in emails:
-                    qc_attachments = email.get_flowtide_attachments()
-
-                    for attachment in qc_attachments:
-                        try:
-                            logger.info(f"  處理附件: {attachment.filename}")
-
-                            # 解析 Excel
-                            sale_date, sales_data = self.parse_sales_excel(
-                                attachment.content,
-                                attachment.filename
-                            )
-
-                            if dry_run:
-                                logger.info(f"  [DRY RUN] 解析成功: {sale_date.strftime('%Y-%m-%d')}, {len(sales_data)} 個品項")
-                                total_success += 1
-                            else:
-                                if self.save_daily_sales(sale_date, sales_data):
-                                    total_success += 1
-                                else:
-                                    total_fail += 1
-
-                        except Exception as e:
-                            logger.error(f"  處理附件失敗 {attachment.filename}: {e}")
-                            total_fail += 1
-
+                return email_service.fetch_flowtide_emails_range(*date_range), None
             except Exception as e:
-                logger.warning(f"  {date_str}: 抓取郵件失敗 - {e}")
-                total_fail += 1
-
-            # 下一天
-            current_date += timedelta(days=1)
+                return None, e
+
+        # 以 FETCH_RANGE_DAYS 天為一個區間，每個區間只做一次 IMAP 搜尋
+        total_days = (end_date - start_date).days + 1
+        date_ranges = [
+            (
+                start_date + timedelta(days=offset),
+                start_date + timedelta(days=min(offset + self.FETCH_RANGE_DAYS, total_days) - 1)
+            )
+            for offset in range(0, total_days, self.FETCH_RANGE_DAYS)
+        ]
+
+        # 每批同時抓取 FETCH_WORKERS 個區間的郵件，Excel 解析（CPU 密集）交給子行程，
+        # 儲存仍依日期順序在本執行緒進行，避免一次載入整段期間
+        # 使用 spawn：本行程可能已有其他執行緒（Flask 背景任務），fork 不安全
+        with ThreadPoolExecutor(max_workers=self.FETCH_WORKERS) as executor, ProcessPoolExecutor(
+            max_workers=self.PARSE_WORKERS, mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_parse_worker
+        ) as parse_pool:
+            for offset in range(0, len(date_ranges), self.FETCH_WORKERS):
+                window = date_ranges[offset:offset + self.FETCH_WORKERS]
+
+                attachments = []
+                for (range_start, range_end), (emails, error) in zip(window, executor.map(_fetch, window)):
+                    date_str = f"{range_start.strftime('%Y-%m-%d')} ~ {range_end.strftime('%Y-%m-%d')}"
+                    logger.info(f"處理日期: {date_str}")
+
+                    if error is not None:
+                        logger.warning(f"  {date_str}: 抓取郵件失敗 - {error}")
+                        total_fail += 1
+                        continue
+
+                    if not emails:
+                        logger.info(f"  {date_str}: 沒有找到郵件")
+                        continue
+
+                    logger.info(f"  {date_str}: 找到 {len(emails)} 封郵件")
+                    for email in emails:
+                        attachments.extend(email.get_flowtide_attachments())
+
+                parsed = parse_pool.map(
+                    self._parse_attachment,
+                    [attachment.content for attachment in attachments],
+                    [attachment.filename for attachment in attachments]
+                )
+
+                for attachment, (result, error, records) in zip(attachments, parsed):
+                    logger.info(f"  處理附件: {attachment.filename}")
+                    # 子行程沒有設定 logger，把解析時的日誌交回本行程輸出
+                    for level, message in records:
+                        logger.log(level, message)
+
+                    if error is not None:
+                        logger.error(f"  處理附件失敗 {attachment.filename}: {error}")
+                        total_fail += 1
+                        continue
+
+                    sale_date, sales_data = result
+                    if dry_run:
+                        logger.info(f"  [DRY RUN] 解析成功: {sale_date.strftime('%Y-%m-%d')}, {len(sales_data)} 個品項")
+                        total_success += 1
+                    elif self.save_daily_sales(sale_date, sales_data):
+                        total_success += 1
+                    else:
+                        total_fail += 1
 
         logger.info("=" * 50)
         logger.info(f"回填完成: 成功 {total_success} 個, 失敗 {total_fail} 個")
         logger.info("=" * 50)
 
         return total_success, total_fail
+
+    @classmethod
+    def _parse_attachment(
+        cls, content: bytes, filename: str
+    ) -> Tuple[Optional[Tuple[datetime, Dict[str, Dict]]], Optional[str], List[Tuple[str, str]]]:
+        """
+        在子行程中解析銷售 Excel，錯誤以字串回傳（例外不一定能跨行程傳遞）
+
+        Args:
+            content: Excel 檔案內容
+            filename: 檔案名稱
+
+        Returns:
+            ((sale_date, sales_data), None, 日誌) 或 (None, 錯誤訊息, 日誌)，
+            日誌為 [(level, message)]，由主行程輸出
+        """
+        records = []
+        sink_id = logger.add(
+            lambda message: records.append((message.record["level"].name, message.record["message"])),
+            level="TRACE",
+        )
+        try:
+            return cls.parse_sales_excel(content, filename), None, records
+        except Exception as e:
+            return None, str(e), records
+        finally:
+            logger.remove(sink_id)
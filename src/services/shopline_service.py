@@ -2,12 +2,13 @@
 ShopLine order service for order status management.
 """
 import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple
 from loguru import logger
 
 from src.repositories.shopline_repository import ShopLineRepository
 from src.repositories.tcat_repository import TcatRepository
-from src.config.config import ConfigManager
+from src.config.config import ConfigManager, load_config_json
 
 
 class ShopLineService:
@@ -15,14 +16,19 @@ class ShopLineService:
     Service for ShopLine order management.
     """
 
-    # Status mapping: Tcat status -> ShopLine delivery status
-    STATUS_MAP = {
-        "arrived": ["順利送達"],
-        "shipped": ["已集貨"],
-        "returning": ["取消取件"],
-        "returned": ["退貨完成"],
+    # Status mapping: ShopLine delivery status -> Tcat statuses (config/status_map.json)
+    STATUS_MAP = load_config_json("status_map.json")
+
+    # Reverse lookup: Tcat status -> ShopLine delivery status
+    TCAT_TO_SHOPLINE_STATUS = {
+        tcat_status: shopline_status
+        for shopline_status, tcat_statuses in STATUS_MAP.items()
+        for tcat_status in tcat_statuses
     }
 
+    # Max orders processed at once against the ShopLine API
+    MAX_WORKERS = 8
+
     def __init__(self):
         """Initialize ShopLine service."""
         self.shopline_repo = ShopLineRepository()
@@ -39,10 +45,10 @@ class ShopLineService:
         Returns:
             ShopLine delivery status or None
         """
-        for shopline_status, tcat_statuses in self.STATUS_MAP.items():
-            if tcat_status in tcat_statuses:
-                return shopline_status
-        return None
+        shopline_status = self.TCAT_TO_SHOPLINE_STATUS.get(tcat_status)
+        if shopline_status is None:
+            logger.trace("黑貓狀態 {} 無對應的 ShopLine 配送狀態", tcat_status)
+        return shopline_status
 
     def process_email_orders(
         self,
@@ -59,49 +65,68 @@ class ShopLineService:
         Returns:
             Tuple of (tracking_updated_count, status_updated_count)
         """
-        tracking_count = 0
-        status_count = 0
+        if not orders:
+            return 0, 0
 
-        for order in orders:
-            order_number = order.get("order_number")
-            tcat_number = order.get("tcat_number")
+        # Orders are independent, so process them concurrently
+        max_workers = min(self.MAX_WORKERS, len(orders))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(lambda order: self._process_email_order(order, notify), orders))
 
-            if not order_number or not tcat_number:
-                continue
+        tracking_count = sum(1 for tracking_updated, _ in results if tracking_updated)
+        status_count = sum(1 for _, status_updated in results if status_updated)
 
-            # Get order from ShopLine
-            order_detail = self.shopline_repo.query_order_by_number(order_number)
-            if not order_detail:
-                logger.warning(f"找不到訂單 {order_number}")
-                continue
+        logger.success(f"更新追蹤資訊 {tracking_count} 筆, 更新狀態 {status_count} 筆")
+        return tracking_count, status_count
 
-            # Check if custom delivery
-            if not self.shopline_repo.is_custom_delivery(order_detail):
-                continue
+    def _process_email_order(self, order: Dict, notify: bool = False) -> Tuple[bool, bool]:
+        """
+        Process a single order from email attachments.
 
-            order_id = order_detail.get("id")
-            current_tracking = self.shopline_repo.get_tracking_number(order_detail)
-            current_status = self.shopline_repo.get_delivery_status(order_detail)
-
-            # Update tracking info if not set
-            if not current_tracking:
-                tracking_url = self.tcat_repo.get_tracking_url(tcat_number)
-                if self.shopline_repo.update_tracking_info(
-                    order_id, tcat_number, tracking_url
-                ):
-                    tracking_count += 1
-                    logger.info(f"更新 {order_number} 追蹤資訊")
-
-            # Get Tcat status and update if needed
-            tcat_status = self.tcat_repo.get_order_status(tcat_number)
-            updated = self._update_order_status(
-                order_id, order_number, tcat_status, current_status, notify
-            )
-            if updated:
-                status_count += 1
+        Args:
+            order: Order dict from email
+            notify: Whether to send email notifications
 
-        logger.success(f"更新追蹤資訊 {tracking_count} 筆, 更新狀態 {status_count} 筆")
-        return tracking_count, status_count
+        Returns:
+            Tuple of (tracking_updated, status_updated)
+        """
+        order_number = order.get("order_number")
+        tcat_number = order.get("tcat_number")
+
+        if not order_number or not tcat_number:
+            return False, False
+
+        # Get order from ShopLine
+        order_detail = self.shopline_repo.query_order_by_number(order_number)
+        if not order_detail:
+            logger.warning(f"找不到訂單 {order_number}")
+            return False, False
+
+        # Check if custom delivery
+        if not self.shopline_repo.is_custom_delivery(order_detail):
+            return False, False
+
+        order_id = order_detail.get("id")
+        current_tracking = self.shopline_repo.get_tracking_number(order_detail)
+        current_status = self.shopline_repo.get_delivery_status(order_detail)
+
+        # Update tracking info if not set
+        tracking_updated = False
+        if not current_tracking:
+            tracking_url = self.tcat_repo.get_tracking_url(tcat_number)
+            if self.shopline_repo.update_tracking_info(
+                order_id, tcat_number, tracking_url
+            ):
+                tracking_updated = True
+                logger.info(f"更新 {order_number} 追蹤資訊")
+
+        # Get Tcat status (memoized per run) and update if needed
+        tcat_status = self.tcat_repo.get_order_status(tcat_number)
+        status_updated = self._update_order_status(
+            order_id, order_number, tcat_status, current_status, notify
+        )
+
+        return tracking_updated, status_updated
 
     def process_outstanding_orders(self, notify: bool = False) -> int:
         """
@@ -116,26 +141,35 @@ class ShopLineService:
         orders = self.shopline_repo.get_all_outstanding_orders()
         update_count = 0
 
+        tracked_orders = []
         for order in orders:
             tracking_number = self.shopline_repo.get_tracking_number(order)
             if not tracking_number:
                 order_num = order.get("order_number", "unknown")
                 logger.warning(f"訂單 {order_num} 沒有追蹤號")
                 continue
-
-            order_id = order.get("id")
-            order_number = order.get("order_number")
-            current_status = self.shopline_repo.get_delivery_status(order)
-
-            # Query Tcat status
-            tcat_status = self.tcat_repo.get_order_status(tracking_number)
-
-            # Update if needed
-            updated = self._update_order_status(
-                order_id, order_number, tcat_status, current_status, notify
+            tracked_orders.append((order, tracking_number))
+
+        # Query Tcat statuses concurrently
+        tcat_statuses = self.tcat_repo.get_order_statuses(
+            tracking_number for _, tracking_number in tracked_orders
+        )
+
+        def _update_one(tracked: Tuple[Dict, str]) -> bool:
+            order, tracking_number = tracked
+            return self._update_order_status(
+                order.get("id"),
+                order.get("order_number"),
+                tcat_statuses[tracking_number],
+                self.shopline_repo.get_delivery_status(order),
+                notify
             )
-            if updated:
-                update_count += 1
+
+        # Orders are independent, so send their ShopLine updates concurrently
+        if tracked_orders:
+            max_workers = min(self.MAX_WORKERS, len(tracked_orders))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                update_count = sum(executor.map(_update_one, tracked_orders))
 
         logger.success(f"更新 {update_count} 筆訂單狀態")
         return update_count
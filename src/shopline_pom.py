@@ -1,9 +1,21 @@
+from functools import lru_cache
 from .selenium_base.base import BaseHandler, Component
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import Select
-import json
 from selenium.webdriver.common.keys import Keys
 from loguru import logger
+from src.config.config import load_config_json
+
+
+@lru_cache(maxsize=None)
+def _postal_code_cities():
+    # postal code -> city, keeping the first city listed for a code
+    cities = {}
+    for city, regions in load_config_json("postal_code.json").items():
+        for code in regions.values():
+            cities.setdefault(code, city)
+    return cities
+
 
 class ShopLinePOM(BaseHandler):
 
@@ -50,13 +62,7 @@ class ShopLinePOM(BaseHandler):
         return self.find_elements(self.delivery_date_time, wait=False)[0].text
 
     def mapping_city(self, postal_code):
-        with open("src/config/postal_code.json", "r", encoding="utf-8") as f:
-            postal_code_dict = json.load(f)
-        for city, region in postal_code_dict.items():
-            for region, code in region.items():
-                if code == postal_code:
-                    return city
-        return None
+        return _postal_code_cities().get(postal_code)
 
     def select_city(self, city):
         select_element = self.find_element(self.selector_recipient_city)
@@ -1,15 +1,112 @@
-import requests
-from bs4 import BeautifulSoup
+from lxml import etree, html
 from loguru import logger
 import datetime
+import html as html_lib
+import re
 import time
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 from src.config.config import ConfigManager
+from src.utils.http import create_session
 
 CONFIG = ConfigManager()
 
 
+def _has_class(name):
+    return f'contains(concat(" ", normalize-space(@class), " "), " {name} ")'
+
+
+# Compiled once and reused for every scraped page
+_ORDER_LIST_XPATH = etree.XPath(f"(//ul[{_has_class('order-list')}])[1]")
+_COL2_XPATH = etree.XPath(f".//div[{_has_class('col-2')}]")
+_RESULT_TABLE_XPATH = etree.XPath("(//table[@id='resultTable'])[1]")
+_ROW_XPATH = etree.XPath(".//tr")
+_STRONG_XPATH = etree.XPath(".//strong")
+_BL12_XPATH = etree.XPath(f".//span[{_has_class('bl12')}]")
+
+
+def _class_attr(name):
+    """class attribute (double, single or unquoted) listing name as a whole class."""
+    token = rf"(?<![\w-]){re.escape(name)}(?![\w-])"
+    return rf"""(?<![\w-])class\s*=\s*(?:"[^"]*{token}[^"]*"|'[^']*{token}[^']*'|{token}(?=[\s/>]))"""
+
+
+def _class_re(tag, name):
+    return re.compile(rf"<{tag}\b[^>]*{_class_attr(name)}[^>]*>(.*?)</{tag}>", re.S | re.I)
+
+
+# Regex fast path for the few fields we read; pages it can't handle fall back to lxml
+_ORDER_LIST_RE = re.compile(rf"<ul\b[^>]*{_class_attr('order-list')}[^>]*>", re.I)
+_UL_END_RE = re.compile(r"</ul\s*>", re.I)
+_COL2_RE = _class_re("div", "col-2")
+_RESULT_TABLE_RE = re.compile(r'<table\b[^>]*\bid="resultTable"[^>]*>(.*?)</table>', re.S | re.I)
+_ROW_RE = re.compile(r"<tr\b[^>]*>(.*?)</tr>", re.S | re.I)
+_STRONG_RE = re.compile(r"<strong\b[^>]*>(.*?)</strong>", re.S | re.I)
+_BL12_RE = _class_re("span", "bl12")
+
+
+def _plain_texts(pattern, fragment):
+    """Stripped texts of all matches, or None if any match contains nested markup."""
+    texts = pattern.findall(fragment)
+    if any("<" in text for text in texts):
+        return None
+    return [html_lib.unescape(text).strip() for text in texts]
+
+
+def _order_list_columns(page):
+    """
+    Texts of the col-2 cells in the first order list of a trace page.
+
+    Returns None when the page has no order list.
+    """
+    match = _ORDER_LIST_RE.search(page)
+    end = _UL_END_RE.search(page, match.end()) if match is not None else None
+    if end is not None:
+        fragment = page[match.end():end.start()]
+        if "<ul" not in fragment.lower():
+            columns = _plain_texts(_COL2_RE, fragment)
+            if columns is not None and len(columns) >= 3:
+                return columns
+
+    list_box = _ORDER_LIST_XPATH(html.fromstring(page))
+    if not list_box:
+        return None
+    return [element.text_content().strip() for element in _COL2_XPATH(list_box[0])]
+
+
+def _parse_time(text):
+    """"YYYY/MM/DD HH:MM" -> "YYYYMMDD"."""
+    return text.partition(" ")[0].replace("/", "", 2)
+
+
+def _result_table_rows(page):
+    """
+    (strong texts, bl12 texts) per row of the trace detail table.
+
+    Returns None when the page has no result table.
+    """
+    match = _RESULT_TABLE_RE.search(page)
+    if match is not None and "<table" not in match.group(1).lower():
+        rows = []
+        for row in _ROW_RE.findall(match.group(1)):
+            strong = _plain_texts(_STRONG_RE, row)
+            bl12 = _plain_texts(_BL12_RE, row)
+            if strong is None or bl12 is None:
+                break
+            rows.append((strong, bl12))
+        else:
+            return rows
+
+    table = _RESULT_TABLE_XPATH(html.fromstring(page))
+    if not table:
+        return None
+    return [
+        (
+            [element.text_content().strip() for element in _STRONG_XPATH(row)],
+            [element.text_content().strip() for element in _BL12_XPATH(row)],
+        )
+        for row in _ROW_XPATH(table[0])
+    ]
+
+
 class Tcat:
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/113.0.0.0 Safari/537.36",
@@ -17,103 +114,97 @@ class Tcat:
         "accept-encoding": "gzip, deflate, br, zstd",
     }
 
+    TRACE_URL = "https://www.t-cat.com.tw/Inquire/Trace.aspx?method=result&billID={}"
+    DETAIL_URL = "https://www.t-cat.com.tw/Inquire/TraceDetail.aspx?BillID={}"
+
+    # Shared keep-alive session, sized for concurrent lookups
+    _session = create_session(headers=headers, backoff_factor=1)
+
+    # Per-run result caches (cleared via clear_cache)
+    _status_cache = {}
+    _collected_time_cache = {}
+
     @classmethod
-    def get_query_url(cls, order_id):
-        return f"https://www.t-cat.com.tw/Inquire/Trace.aspx?method=result&billID={order_id}"
+    def clear_cache(cls):
+        cls._status_cache.clear()
+        cls._collected_time_cache.clear()
 
     @classmethod
-    def _create_session(cls):
-        session = requests.Session()
-        retry = Retry(total=3, backoff_factor=1, status_forcelist=[500, 502, 503, 504])
-        adapter = HTTPAdapter(max_retries=retry)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-        return session
+    def get_query_url(cls, order_id):
+        return cls.TRACE_URL.format(order_id)
+
 
     @classmethod
     def order_status(cls, order_id):
+        cached = cls._status_cache.get(order_id)
+        if cached is not None:
+            return cached
         url = cls.get_query_url(order_id)
-        session = cls._create_session()
         try:
-            response = session.get(url, timeout=10, headers=cls.headers)
+            response = cls._session.get(url, timeout=10)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
-            list_box = soup.find("ul", class_="order-list")
-            if list_box:
-                status_element = list_box.find_all("div", class_="col-2")
-                order_status = status_element[1]
-                if order_status:
-                    status_text = order_status.text.strip()
-                    logger.debug(f"訂單 {order_id} 狀態 : {status_text}")
-                    return status_text
+            columns = _order_list_columns(response.text)
+            if columns:
+                status_text = columns[1]
+                cls._status_cache[order_id] = status_text
+                return status_text
             else:
                 logger.warning(f"訂單 {order_id} 狀態 : 暫無資料")
+                cls._status_cache[order_id] = CONFIG.c2c_status_no_data
                 return CONFIG.c2c_status_no_data
         except Exception as e:
             logger.error(f"查詢訂單 {order_id} 狀態時發生錯誤: {str(e)}")
             return CONFIG.c2c_status_no_data
-        finally:
-            session.close()
 
     @classmethod
     def current_state_update_time(cls, order_id):
-        url = f"https://www.t-cat.com.tw/Inquire/Trace.aspx?method=result&billID={order_id}"
-        session = cls._create_session()
+        url = cls.get_query_url(order_id)
         try:
-            response = session.get(url, timeout=10, headers=cls.headers)
+            response = cls._session.get(url, timeout=10)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
-            list_box = soup.find("ul", class_="order-list")
-            if list_box:
-                status_element = list_box.find_all("div", class_="col-2")
-                update_time = status_element[2]
-                if update_time:
-                    update_time_text = update_time.text.strip()
-                    try:
-                        dt = datetime.datetime.strptime(update_time_text, "%Y/%m/%d %H:%M")
-                        formatted_date = dt.strftime("%Y%m%d")
-                        return formatted_date
-                    except ValueError as e:
-                        logger.error(f"時間格式轉換錯誤: {e}")
-                        return ""
+            columns = _order_list_columns(response.text)
+            if columns:
+                update_time_text = columns[2]
+                try:
+                    dt = datetime.datetime.strptime(update_time_text, "%Y/%m/%d %H:%M")
+                    formatted_date = dt.strftime("%Y%m%d")
+                    return formatted_date
+                except ValueError as e:
+                    logger.error(f"時間格式轉換錯誤: {e}")
+                    return ""
             logger.warning(f"無法爬蟲到該訂單的更新時間 {order_id}")
             return ""
         except Exception as e:
             logger.error(f"查詢訂單 {order_id} 更新時間時發生錯誤: {str(e)}")
             return ""
-        finally:
-            session.close()
 
     @classmethod
     def order_detail_find_collected_time(cls, order_id, retry=2, current_state=None):
+        key = (order_id, current_state)
+        if key in cls._collected_time_cache:
+            return cls._collected_time_cache[key]
+        collected_time = cls._fetch_collected_time(order_id, retry, current_state)
+        if collected_time:
+            cls._collected_time_cache[key] = collected_time
+        return collected_time
+
+    @classmethod
+    def _fetch_collected_time(cls, order_id, retry=2, current_state=None):
 
-        url = f"https://www.t-cat.com.tw/Inquire/TraceDetail.aspx?BillID={order_id}"
-        session = cls._create_session()
+        url = cls.DETAIL_URL.format(order_id)
         try:
             if CONFIG.c2c_status_collected == current_state:
                 return cls.current_state_update_time(order_id)
-            response = session.get(url, timeout=10, headers=cls.headers)
+            response = cls._session.get(url, timeout=10)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            table = soup.find("table", id="resultTable")
-            if table:
-                table_data = table.find_all("tr")
+            table_data = _result_table_rows(response.text)
+            if table_data is not None:
                 timeline = []
-
-                def _parse_time(time: str):
-                    date = time.split(" ")[0]
-                    return date.replace("/", "")
-
-                for block in table_data:
-                    arrived = block.find("strong")
-                    arrive_time = block.find_all("span", class_="bl12")
+                for arrived, arrive_time in table_data:
                     if arrived and arrive_time:
-                        timeline.append({"status": arrived.text.strip(), "time": _parse_time(arrive_time[1].text.strip())})
-                    else:
-                        record = block.find_all("span", class_="bl12")
-                        if record:
-                            timeline.append({"status": record[0].text.strip(), "time": _parse_time(record[1].text.strip())})
+                        timeline.append({"status": arrived[0], "time": _parse_time(arrive_time[1])})
+                    elif arrive_time:
+                        timeline.append({"status": arrive_time[0], "time": _parse_time(arrive_time[1])})
 
                 for s in timeline:
                     if s["status"] == CONFIG.c2c_status_collected:
@@ -126,8 +217,6 @@ class Tcat:
             logger.error(f"查詢訂單 {order_id} 收件時間時發生錯誤: {str(e)}")
             if retry > 0:
                 time.sleep(1)
-                return cls.order_detail_find_collected_time(order_id, retry - 1)
+                return cls._fetch_collected_time(order_id, retry - 1)
             logger.error(f"查詢訂單 {order_id} 超時,錯誤次數太多")
             return ""
-        finally:
-            session.close()
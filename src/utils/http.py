@@ -0,0 +1,48 @@
+"""
+Shared HTTP session helpers.
+"""
+from typing import Iterable, Optional, Dict
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def create_session(
+    headers: Optional[Dict[str, str]] = None,
+    pool_maxsize: int = 32,
+    total_retries: int = 3,
+    backoff_factor: float = 0.5,
+    status_forcelist: Iterable[int] = (429, 500, 502, 503, 504)
+) -> requests.Session:
+    """
+    Create a requests Session with a keep-alive connection pool and retries.
+
+    Reusing one session per host avoids a new TCP/TLS handshake on every call.
+
+    Args:
+        headers: Default headers sent with every request
+        pool_maxsize: Max pooled connections per host (should cover the thread pool size)
+        total_retries: Max retry attempts for idempotent requests
+        backoff_factor: Exponential backoff factor between retries
+        status_forcelist: HTTP status codes that trigger a retry
+
+    Returns:
+        Configured Session
+    """
+    session = requests.Session()
+    if headers:
+        session.headers.update(headers)
+
+    # raise_on_status=False: once retries run out the last response is returned, so callers
+    # still see the 429/5xx status instead of a RetryError
+    retry = Retry(
+        total=total_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=list(status_forcelist),
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
@@ -2,6 +2,7 @@
 Unified logging configuration for the application.
 """
 
+import os
 import sys
 from loguru import logger
 from typing import Optional
@@ -13,11 +14,15 @@ def setup_logger(log_file: str = "logs/app.log", level: str = "DEBUG", rotation:
 
     Args:
         log_file: Path to the log file
-        level: Minimum log level for file output
+        level: Minimum log level for file output (BAGEL_TRACE=1 forces TRACE,
+            which includes the per-order lookup logs)
         rotation: When to rotate the log file (e.g., "100 MB", "1 day")
         retention: How long to keep old log files
         compression: Compression format for rotated files
     """
+    if os.getenv("BAGEL_TRACE") == "1":
+        level = "TRACE"
+
     # Remove default handler
     logger.remove()
 
@@ -28,7 +33,7 @@ def setup_logger(log_file: str = "logs/app.log", level: str = "DEBUG", rotation:
         level="INFO",
     )
 
-    # File handler - configurable level
+    # File handler - configurable level, written from a background thread
     logger.add(
         log_file,
         format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {function}:{line} - {message}",
@@ -37,6 +42,7 @@ def setup_logger(log_file: str = "logs/app.log", level: str = "DEBUG", rotation:
         retention=retention,
         compression=compression,
         encoding="utf-8",
+        enqueue=True,
     )
 
 
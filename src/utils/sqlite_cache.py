@@ -0,0 +1,68 @@
+"""
+Persistent key/value cache backed by a local SQLite file.
+"""
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Tuple
+
+
+class SQLiteCache:
+    """
+    Small string cache that survives across runs.
+
+    Each entry records when it was stored, so callers can decide how old a
+    value may be before it must be refreshed. A single connection is shared
+    between threads and guarded by a lock.
+    """
+
+    def __init__(self, path: str, table: str = "cache"):
+        """
+        Open (and create if needed) the cache database.
+
+        Args:
+            path: SQLite database file path
+            table: Table name holding the entries
+        """
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.table = table
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL, stored_at REAL NOT NULL)"
+        )
+
+    def get(self, key: str) -> Optional[Tuple[str, float]]:
+        """
+        Get a cached value and its age.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            (value, age in seconds) or None if the key is not cached
+        """
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT value, stored_at FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        value, stored_at = row
+        return value, time.time() - stored_at
+
+    def set(self, key: str, value: str) -> None:
+        """
+        Store a value, replacing any previous entry for the key.
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        with self._lock:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, stored_at) VALUES (?, ?, ?)",
+                (key, value, time.time())
+            )
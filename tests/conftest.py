@@ -0,0 +1,5 @@
+import os
+
+# SettingsManager reads these at import time; tests never reach the real services
+for name in ("SHOPLINE_TOKEN", "GMAIL_ADDRESS", "GMAIL_APP_PASSWORD", "LINE_ACCESS_TOKEN", "LINE_GROUP_ID"):
+    os.environ.setdefault(name, "test")
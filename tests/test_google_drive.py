@@ -0,0 +1,51 @@
+import pandas as pd
+
+from src.google_drive import C2CGoogleSheet, CONFIG, a1_range
+
+
+class FakeSpreadsheet:
+    id = "spreadsheet-id"
+
+
+class FakeWorksheet:
+    title = "O'Brien"
+    spreadsheet = FakeSpreadsheet()
+
+
+def make_drive():
+    drive = C2CGoogleSheet.__new__(C2CGoogleSheet)
+    drive.updates = []
+    drive.batch_update_values = lambda spreadsheet_id, data: drive.updates.append(data)
+    return drive
+
+
+def test_a1_range_escapes_quotes_in_titles():
+    assert a1_range("O'Brien") == "'O''Brien'"
+    assert a1_range("O'Brien", "M2") == "'O''Brien'!M2"
+
+
+def test_update_worksheet_sends_only_changed_cells():
+    protected = [f"p{i}" for i in range(12)]
+    headers = protected + [CONFIG.c2c_delivery_number, "status"]
+    current_values = [
+        headers,
+        [""] * 12 + ["A1", "old"],
+        [""] * 12 + ["B2", "same"],
+    ]
+    df = pd.DataFrame({CONFIG.c2c_delivery_number: ["A1", "B2"], "status": ["new", "same"]})
+    drive = make_drive()
+
+    assert drive.update_worksheet(FakeWorksheet(), df, current_values)
+
+    assert drive.updates == [[{"range": "'O''Brien'!N2", "values": [["new"]]}]]
+
+
+def test_update_worksheet_skips_the_request_when_nothing_changed():
+    headers = [f"p{i}" for i in range(12)] + [CONFIG.c2c_delivery_number]
+    current_values = [headers, [""] * 12 + ["A1"]]
+    df = pd.DataFrame({CONFIG.c2c_delivery_number: ["A1"]})
+    drive = make_drive()
+
+    assert drive.update_worksheet(FakeWorksheet(), df, current_values)
+
+    assert drive.updates == []
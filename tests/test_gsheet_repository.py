@@ -0,0 +1,46 @@
+from src.repositories.gsheet_repository import GoogleSheetRepository
+
+
+class FakeWorksheet:
+    """In-memory stand-in for a pygsheets worksheet grid."""
+
+    def __init__(self, rows, cols):
+        self.grid = [[""] * cols for _ in range(rows)]
+
+    @property
+    def rows(self):
+        return len(self.grid)
+
+    @property
+    def cols(self):
+        return len(self.grid[0]) if self.grid else 0
+
+    def resize(self, rows, cols):
+        grid = [row[:cols] + [""] * (cols - len(row[:cols])) for row in self.grid[:rows]]
+        grid += [[""] * cols for _ in range(rows - len(grid))]
+        self.grid = grid
+
+    def update_values(self, crange, values):
+        for r, row in enumerate(values):
+            for c, value in enumerate(row):
+                self.grid[r][c] = value
+
+
+def make_repo(worksheet):
+    repo = GoogleSheetRepository.__new__(GoogleSheetRepository)
+    repo.open_sheet = lambda name: True
+    repo.get_worksheet = lambda index=0: worksheet
+    return repo
+
+
+def test_smaller_backup_replaces_larger_one():
+    worksheet = FakeWorksheet(rows=1, cols=1)
+    repo = make_repo(worksheet)
+
+    large = [[f"a{r}{c}" for c in range(4)] for r in range(5)]
+    small = [["h1", "h2"], ["b1", "b2"]]
+
+    assert repo.backup_to_sheet(large, "backup")
+    assert repo.backup_to_sheet(small, "backup")
+
+    assert worksheet.grid == small
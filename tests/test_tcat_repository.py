@@ -0,0 +1,71 @@
+import pytest
+
+from src.repositories import tcat_repository
+from src.repositories.tcat_repository import TcatRepository
+from src.tcat_scraping import Tcat
+
+
+def trace_page(status):
+    return (
+        '<ul class="order-list"><li>'
+        '<div class="col-2">123</div>'
+        f'<div class="col-2">{status}</div>'
+        '<div class="col-2">2024/01/02 10:00</div>'
+        '</li></ul>'
+    )
+
+
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    """Serves the current status page and counts requests."""
+
+    def __init__(self, status):
+        self.status = status
+        self.calls = 0
+
+    def get(self, url, timeout=None):
+        self.calls += 1
+        return FakeResponse(trace_page(self.status))
+
+
+@pytest.fixture
+def session(tmp_path, monkeypatch):
+    monkeypatch.setattr(tcat_repository, "TCAT_CACHE_PATH", str(tmp_path / "tcat.sqlite"))
+    monkeypatch.setattr(TcatRepository, "_status_store", None)
+    fake = FakeSession("已集貨")
+    monkeypatch.setattr(Tcat, "_session", fake)
+    TcatRepository.clear_cache()
+    yield fake
+    TcatRepository.clear_cache()
+
+
+def test_in_transit_status_is_refetched_after_clear_cache(session):
+    repo = TcatRepository()
+
+    assert repo.get_order_status("123") == "已集貨"
+    assert repo.get_order_status("123") == "已集貨"
+    assert session.calls == 1
+
+    session.status = "配送中"
+    TcatRepository.clear_cache()
+
+    assert repo.get_order_status("123") == "配送中"
+    assert session.calls == 2
+
+
+def test_delivered_status_is_reused_across_runs(session):
+    repo = TcatRepository()
+    session.status = "順利送達"
+
+    assert repo.get_order_status("123") == "順利送達"
+    TcatRepository.clear_cache()
+
+    assert repo.get_order_status("123") == "順利送達"
+    assert session.calls == 1
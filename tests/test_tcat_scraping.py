@@ -0,0 +1,47 @@
+from src.tcat_scraping import _order_list_columns
+
+
+def test_col2_cells_after_the_order_list_are_ignored():
+    page = (
+        '<ul class="order-list"><li>'
+        '<div class="col-2">a</div><div class="col-2">b</div><div class="col-2">c</div>'
+        '</li></ul>'
+        '<div class="col-2">X</div><div class="col-2">Y</div>'
+    )
+
+    assert _order_list_columns(page) == ["a", "b", "c"]
+
+
+def test_hyphenated_classes_are_not_col2():
+    page = (
+        '<ul class="order-list"><li>'
+        '<div class="col-2">a</div><div class="col-2-wide">W</div>'
+        '<div class="col-2">b</div><div class="col-2">c</div>'
+        '</li></ul>'
+    )
+
+    assert _order_list_columns(page) == ["a", "b", "c"]
+
+
+def test_single_and_unquoted_classes_are_parsed():
+    page = (
+        "<ul class='order-list'><li>"
+        "<div class='col-2'>a</div><div class=col-2>b</div><div class='col-2'>c</div>"
+        "</li></ul>"
+    )
+
+    assert _order_list_columns(page) == ["a", "b", "c"]
+
+
+def test_pages_the_regex_misses_fall_back_to_lxml():
+    page = (
+        "<ul class=order-list><li>"
+        '<div class="col-2">a</div><div class="col-2"><b>b</b></div>'
+        "</li></ul>"
+    )
+
+    assert _order_list_columns(page) == ["a", "b"]
+
+
+def test_page_without_order_list_returns_none():
+    assert _order_list_columns('<div class="col-2">X</div>') is None